@@ -6,98 +6,461 @@ This bot uses a command queue system where each command represents an atomic act
 that the bot executes sequentially.
 """
 
-from collections import deque
+import heapq
+import logging
+from array import array
 from typing import Tuple, Optional, List, Dict
 from abc import ABC, abstractmethod
 
 from robot_controller import RobotController
 from game_constants import FoodType, ShopCosts
+from item import Food, Plate, Pan
+
+# Progress messages go through this logger; enable with
+# logging.getLogger("command_bot4").setLevel(logging.DEBUG).
+# Messages use %-style arguments so nothing is formatted while DEBUG is off.
+log = logging.getLogger("command_bot4")
 
 
 # ============================================================================
 # PATHFINDING UTILITIES
 # ============================================================================
 
-def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-    """BFS pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable."""
-    gx, gy = goal
-    sx, sy = start
+# The 8 king moves (Chebyshev neighbours), in the order the searches expand them
+_DIRS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# team -> (turn, map) for get_turn_map()
+_turn_maps: Dict = {}
 
-    # Already adjacent (Chebyshev distance <= 1)?
-    if max(abs(sx - gx), abs(sy - gy)) <= 1:
-        return None
 
-    queue = deque([(start, [])])
-    visited = {start}
-    m = controller.get_map(controller.get_team())
+def get_turn_map(controller: RobotController):
+    """
+    Get our map for the current turn.
 
-    # Mark occupied tiles (other bots)
-    occupied = set()
-    for bid in controller.get_team_bot_ids(controller.get_team()):
-        st = controller.get_bot_state(bid)
-        if st:
-            occupied.add((st['x'], st['y']))
+    controller.get_map() deep-copies the whole map on every call, so a single
+    snapshot is fetched per turn and shared by every lookup made during it.
+    """
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_maps.get(team)
+    if cached is None or cached[0] != turn:
+        cached = (turn, controller.get_map(team))
+        _turn_maps[team] = cached
+    return cached[1]
 
-    while queue:
-        (x, y), path = queue.popleft()
+
+# team -> {tile_name: [(x, y), ...]} for get_tile_index()
+_tile_index: Dict = {}
+
+
+def get_tile_index(controller: RobotController) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Positions of every tile on our map, grouped by tile name.
+
+    Tile types never change during a game, so the index is built from a single
+    map copy on first use. Positions are in the same column-major order the
+    map scans below always used, so "first tile" keeps its meaning.
+    """
+    team = controller.get_team()
+    index = _tile_index.get(team)
+    if index is None:
+        index = {}
+        m = get_turn_map(controller)
+        for x in range(m.width):
+            for y in range(m.height):
+                index.setdefault(m.tiles[x][y].tile_name, []).append((x, y))
+        _tile_index[team] = index
+    return index
+
+
+# team -> (turn, {(tile_name, item class): [(x, y), ...]}) for get_turn_items()
+_turn_items: Dict = {}
+
+
+def get_turn_items(controller: RobotController) -> Dict[Tuple[str, type], List[Tuple[int, int]]]:
+    """
+    Positions of every item on this turn's map, grouped by (tile name, item class).
+
+    Built with one pass over the turn's map snapshot, so "a Plate on a COUNTER"
+    is a single dict lookup. Positions keep the column-major scan order.
+    """
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_items.get(team)
+    if cached is None or cached[0] != turn:
+        items = {}
+        for x, column in enumerate(get_turn_map(controller).tiles):
+            for y, tile in enumerate(column):
+                item = getattr(tile, "item", None)
+                if item is not None:
+                    items.setdefault((tile.tile_name, type(item)), []).append((x, y))
+        cached = (turn, items)
+        _turn_items[team] = cached
+    return cached[1]
+
+
+# team -> (turn, {(x, y): (food_name, cooked_stage)}) for get_turn_pans()
+_turn_pans: Dict = {}
+
+
+def get_turn_pans(controller: RobotController) -> Dict[Tuple[int, int], Tuple[Optional[str], int]]:
+    """
+    What each pan on a cooker holds this turn, as (food name, cooked stage).
+
+    Flattened once per turn from the item buckets, so cooking checks compare
+    plain values instead of chasing tile -> pan -> food attributes. An empty
+    pan is (None, 0). Cookers keep the column-major scan order.
+    """
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_pans.get(team)
+    if cached is None or cached[0] != turn:
+        tiles = get_turn_map(controller).tiles
+        pans = {}
+        for x, y in get_turn_items(controller).get(("COOKER", Pan), ()):
+            food = getattr(tiles[x][y].item, "food", None)
+            if food is None:
+                pans[(x, y)] = (None, 0)
+            else:
+                pans[(x, y)] = (getattr(food, "food_name", None), getattr(food, "cooked_stage", 0))
+        cached = (turn, pans)
+        _turn_pans[team] = cached
+    return cached[1]
+
+
+# team -> (stride, walkable bytes) for get_walk_grid()
+_walk_grids: Dict = {}
+
+
+def get_walk_grid(controller: RobotController) -> Tuple[int, bytearray]:
+    """
+    Walkability of our map as a flat bytearray, built once per game.
+
+    The grid is padded with a one-tile unwalkable border, so tile (x, y) is at
+    (x + 1) * stride + (y + 1) and neighbour lookups never need a bounds check.
+    """
+    team = controller.get_team()
+    grid = _walk_grids.get(team)
+    if grid is None:
+        m = get_turn_map(controller)
+        stride = m.height + 2
+        walk = bytearray((m.width + 2) * stride)
+        for x in range(m.width):
+            for y in range(m.height):
+                if m.tiles[x][y].is_walkable:
+                    walk[(x + 1) * stride + y + 1] = 1
+        grid = (stride, walk)
+        _walk_grids[team] = grid
+    return grid
+
+
+# team -> (turn, occupied grid indices) for get_turn_occupied()
+_turn_occupied: Dict = {}
+
+
+def get_turn_occupied(controller: RobotController) -> set:
+    """
+    Tiles occupied by our bots this turn, as walk-grid indices (see get_walk_grid).
+
+    Every path search needs the same set, so it is gathered once per turn
+    instead of fetching every bot's state on each search. Plain int keys hash
+    and compare faster than (x, y) tuples and need no tuple per lookup.
+    """
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_occupied.get(team)
+    if cached is None or cached[0] != turn:
+        stride = get_walk_grid(controller)[0]
+        occupied = set()
+        for bid in controller.get_team_bot_ids(team):
+            st = controller.get_bot_state(bid)
+            if st:
+                occupied.add((st['x'] + 1) * stride + st['y'] + 1)
+        cached = (turn, occupied)
+        _turn_occupied[team] = cached
+    return cached[1]
+
+
+# grid size -> [stamp, seen, best, prev, open list] scratch reused by astar_path()
+_astar_pools: Dict = {}
+
+
+def astar_path(walk: bytearray, stride: int, occupied, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    """
+    A* kernel over a padded walk grid (see get_walk_grid), working on flat tile indices.
+    occupied is a set of grid indices to route around (see get_turn_occupied).
+
+    Moves cost 1 in all 8 directions, so ordering by steps taken plus Chebyshev
+    distance to the ring around the goal returns a shortest path while expanding
+    far fewer tiles than a plain BFS on open maps. Among equally promising tiles
+    the one furthest along is expanded first, so the search runs down one of the
+    many equivalent shortest paths instead of widening across all of them.
+
+    Step counts and back-pointers live in flat lists indexed like the grid; they
+    are reused between calls and a tile's entries only count if its stamp
+    matches this call. Returns the tiles to step through (excluding start) to
+    reach a tile adjacent to goal, or None if there is no such path.
+    """
+    gx, gy = goal
+    sx, sy = start
+
+    # Already adjacent: nothing to search, leave the scratch pool untouched
+    if -1 <= sx - gx <= 1 and -1 <= sy - gy <= 1:
+        return []
+
+    size = len(walk)
+    start_cell = (sx + 1) * stride + sy + 1
+
+    pool = _astar_pools.get(size)
+    if pool is None:
+        pool = [0, [0] * size, [0] * size, [0] * size, []]
+        _astar_pools[size] = pool
+    pool[0] += 1
+    stamp = pool[0]
+    seen = pool[1]  # seen[i] == stamp: tile i was reached during this call
+    best = pool[2]  # Fewest steps found to each tile
+    prev = pool[3]  # Back-pointer to the tile each one was reached from
+    seen[start_cell] = stamp
+    best[start_cell] = 0
+
+    # Open list of (steps + heuristic, -steps, tile index)
+    open_list = pool[4]
+    open_list.clear()
+    open_list.append((max(abs(sx - gx), abs(sy - gy)) - 1, 0, start_cell))
+
+    while open_list:
+        _, g, cell = heapq.heappop(open_list)
+        g = -g
+        if g > best[cell]:
+            continue  # Stale entry, a shorter route was found later
+
+        x, y = divmod(cell, stride)
+        x -= 1
+        y -= 1
 
         # Check if we're adjacent to goal
-        if max(abs(x - gx), abs(y - gy)) <= 1:
-            return path[0] if path else None
+        if -1 <= x - gx <= 1 and -1 <= y - gy <= 1:
+            # Walk the back-pointers to start
+            path = []
+            while cell != start_cell:
+                px, py = divmod(cell, stride)
+                path.append((px - 1, py - 1))
+                cell = prev[cell]
+            path.reverse()
+            return path
+
+        g += 1
 
         # Explore 8 directions (Chebyshev)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
+        for dx, dy in _DIRS8:
+            n = cell + dx * stride + dy
 
-                if (nx, ny) in visited:
-                    continue
-                if not (0 <= nx < m.width and 0 <= ny < m.height):
-                    continue
-                if (nx, ny) in occupied and (nx, ny) != start:
-                    continue
-                if not m.tiles[nx][ny].is_walkable:
-                    continue
+            if not walk[n]:
+                continue  # Wall, or the padding outside the map
+            if seen[n] == stamp and best[n] <= g:
+                continue
+            if n in occupied:
+                continue
+            nx, ny = x + dx, y + dy
 
-                visited.add((nx, ny))
-                queue.append(((nx, ny), path + [(dx, dy)]))
+            seen[n] = stamp
+            best[n] = g
+            prev[n] = cell
+            h = max(max(abs(nx - gx), abs(ny - gy)) - 1, 0)
+            heapq.heappush(open_list, (g + h, -g, n))
 
     return None  # Unreachable
 
 
+# (team, goal) -> walking distances to goal for goal_field()
+_goal_fields: Dict = {}
+
+
+def goal_field(controller: RobotController, goal: Tuple[int, int]) -> array:
+    """
+    Steps from every tile to the nearest tile adjacent to goal, flat over the
+    padded walk grid (see get_walk_grid); -1 where goal cannot be reached.
+
+    Walls never move, so one BFS outward from the goal answers every later
+    step toward it, from any start and for every bot. A field is kept for each
+    goal for the whole game, so it is packed as 16-bit ints rather than a list
+    of int objects, a quarter of the size.
+    """
+    key = (controller.get_team(), goal)
+    dist = _goal_fields.get(key)
+    if dist is None:
+        stride, walk = get_walk_grid(controller)
+        dist = array('h', [-1]) * len(walk)
+        offsets = [dx * stride + dy for dx, dy in _DIRS8]
+        g = (goal[0] + 1) * stride + goal[1] + 1
+        frontier = [g + o for o in offsets if walk[g + o]]
+        for cell in frontier:
+            dist[cell] = 0
+        d = 0
+        while frontier:
+            d += 1
+            next_frontier = []
+            for cell in frontier:
+                for o in offsets:
+                    n = cell + o
+                    if walk[n] and dist[n] < 0:
+                        dist[n] = d
+                        next_frontier.append(n)
+            frontier = next_frontier
+        _goal_fields[key] = dist
+    return dist
+
+
+def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """
+    Pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable.
+
+    The next step is read off the goal's distance field (see goal_field): any
+    neighbour one step closer will do. Only when our own bots stand on all of
+    them is a path around them searched for.
+    """
+    gx, gy = goal
+    sx, sy = start
+
+    # Already adjacent (Chebyshev distance <= 1)?
+    if -1 <= sx - gx <= 1 and -1 <= sy - gy <= 1:
+        return None
+
+    stride, walk = get_walk_grid(controller)
+    dist = goal_field(controller, goal)
+    s = (sx + 1) * stride + sy + 1
+    d = dist[s] - 1
+    if d < 0:
+        return None  # Unreachable
+
+    occupied = get_turn_occupied(controller)
+    for dx, dy in _DIRS8:
+        n = s + dx * stride + dy
+        if dist[n] == d and n not in occupied:
+            return (dx, dy)
+
+    path = astar_path(walk, stride, occupied, start, goal)
+    if not path:
+        return None
+    nx, ny = path[0]
+    return (nx - sx, ny - sy)
+
+
+def step_towards(controller: RobotController, bot_id: int, start: Tuple[int, int], goal: Tuple[int, int]) -> None:
+    """Move bot_id one step along a shortest path toward a tile adjacent to goal (no-op if adjacent or unreachable)."""
+    next_move = bfs_to_adjacent(controller, start, goal)
+    if next_move:
+        controller.move(bot_id, next_move[0], next_move[1])
+
+
 def find_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first tile of given type."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            if m.tiles[x][y].tile_name == tile_name:
-                return (x, y)
-    return None
+    positions = get_tile_index(controller).get(tile_name)
+    return positions[0] if positions else None
+
+
+# (team, tile_name) -> nearest tile per walk-grid cell, see nearest_tile()
+_nearest_fields: Dict = {}
+
+
+def nearest_tile(controller: RobotController, tile_name: str, start: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """
+    Find the tile of given type closest to start by walking distance.
+
+    The first lookup for a tile type runs one multi-source BFS, seeded from every
+    walkable cell next to a tile of that type, and labels each reachable cell
+    with the tile it is nearest to. Later lookups are a single list index.
+    Falls back to find_tile() if start cannot reach any such tile.
+    """
+    key = (controller.get_team(), tile_name)
+    stride, walk = get_walk_grid(controller)
+    owners = _nearest_fields.get(key)
+    if owners is None:
+        # Same flat int kernel as goal_field(): no tuples or bounds checks per step
+        owners = [None] * len(walk)
+        offsets = [dx * stride + dy for dx, dy in _DIRS8]
+        frontier = []
+        for tx, ty in get_tile_index(controller).get(tile_name, ()):
+            t = (tx + 1) * stride + ty + 1
+            for n in (t - stride - 1, t - stride, t - stride + 1, t - 1, t, t + 1,
+                      t + stride - 1, t + stride, t + stride + 1):
+                if walk[n] and owners[n] is None:
+                    owners[n] = (tx, ty)
+                    frontier.append(n)
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                owner = owners[cell]
+                for o in offsets:
+                    n = cell + o
+                    if walk[n] and owners[n] is None:
+                        owners[n] = owner
+                        next_frontier.append(n)
+            frontier = next_frontier
+        _nearest_fields[key] = owners
+
+    owner = owners[(start[0] + 1) * stride + start[1] + 1]
+    return owner if owner is not None else find_tile(controller, tile_name)
+
+
+def closest_tile(controller: RobotController, start: Tuple[int, int], candidates: List[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    """
+    Pick the candidate tile with the shortest walk from start (see goal_field).
+
+    Ties keep candidate order. If none can be reached, the first one is returned.
+    """
+    if not candidates:
+        return None
+    stride = get_walk_grid(controller)[0]
+    s = (start[0] + 1) * stride + start[1] + 1
+    best, best_dist = candidates[0], -1
+    for pos in candidates:
+        d = goal_field(controller, pos)[s]
+        if d >= 0 and (best_dist < 0 or d < best_dist):
+            best, best_dist = pos, d
+    return best
 
 
 def find_empty_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first empty tile of given type (no item on it)."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name and getattr(tile, "item", None) is None:
-                return (x, y)
+    positions = get_tile_index(controller).get(tile_name)
+    if not positions:
+        return None
+    # This turn's item buckets already say which of these tiles hold something
+    filled = set()
+    for (name, _), found in get_turn_items(controller).items():
+        if name == tile_name:
+            filled.update(found)
+    for pos in positions:
+        if pos not in filled:
+            return pos
     return None
 
 
+def find_free_cooker(controller: RobotController) -> Optional[Tuple[int, int]]:
+    """Find first cooker whose pan is empty (None while every pan is busy or gone)."""
+    for loc, (food_name, _) in get_turn_pans(controller).items():
+        if food_name is None:
+            return loc
+    return None
+
+
+def tile_has_item(controller: RobotController, loc: Tuple[int, int]) -> bool:
+    """Whether this turn's map shows an item on the tile at loc."""
+    x, y = loc
+    return getattr(get_turn_map(controller).tiles[x][y], "item", None) is not None
+
+
 def find_item_on_tile(controller: RobotController, tile_name: str, item_check) -> Optional[Tuple[int, int]]:
     """Find tile with specific item. item_check is a lambda that takes item and returns bool."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name:
-                item = getattr(tile, "item", None)
-                if item and item_check(item):
-                    return (x, y)
+    positions = get_tile_index(controller).get(tile_name)
+    if not positions:
+        return None
+    tiles = get_turn_map(controller).tiles
+    for x, y in positions:
+        item = getattr(tiles[x][y], "item", None)
+        if item and item_check(item):
+            return (x, y)
     return None
 
 
@@ -105,6 +468,13 @@ def find_item_on_tile(controller: RobotController, tile_name: str, item_check) -
 # COMMAND FRAMEWORK
 # ============================================================================
 
+# States of the multi-turn commands; each one maps them to a step method in _STEPS
+NAVIGATING, PLACING, CHOPPING, COOKING, WAITING, ADDING, PICKING_UP, DONE = range(8)
+
+# Item class behind each holding 'type' that get_bot_state() reports
+ITEM_CLASSES = {'Food': Food, 'Plate': Plate, 'Pan': Pan}
+
+
 class Command(ABC):
     """
     Base class for all bot commands.
@@ -113,6 +483,8 @@ class Command(ABC):
     Commands execute over multiple turns until completion.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, controller: RobotController, bot_id: int) -> None:
         """Execute one step of this command (called each turn)."""
@@ -144,8 +516,11 @@ class Command(ABC):
 class BuyIngredientCommand(Command):
     """Command: Buy a specific ingredient from shop."""
 
+    __slots__ = ('food_type', 'food_name', 'shop_loc')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
+        self.food_name = food_type.name  # Enum .name is a property; read it once
         self.shop_loc = None
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
@@ -157,31 +532,29 @@ class BuyIngredientCommand(Command):
 
         # Find shop
         if self.shop_loc is None:
-            self.shop_loc = find_tile(controller, "SHOP")
+            self.shop_loc = nearest_tile(controller, "SHOP", (bx, by))
             if not self.shop_loc:
                 return
 
         sx, sy = self.shop_loc
 
         # Adjacent to shop? Buy it!
-        if max(abs(bx - sx), abs(by - sy)) <= 1:
+        if -1 <= bx - sx <= 1 and -1 <= by - sy <= 1:
             controller.buy(bot_id, self.food_type, sx, sy)
             return
 
         # Navigate to shop
-        next_move = bfs_to_adjacent(controller, (bx, by), self.shop_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.shop_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # holding is a dict with keys: type, food_name, food_id, chopped, cooked_stage
         return (holding is not None and
-                holding.get('type') == 'Food' and
-                holding.get('food_name') == self.food_type.name)
+                holding['type'] == 'Food' and
+                holding['food_name'] == self.food_name)
 
     def __str__(self) -> str:
         return f"BuyIngredient({self.food_type.name})"
@@ -190,6 +563,8 @@ class BuyIngredientCommand(Command):
 class BuyPlateCommand(Command):
     """Command: Buy a plate from shop."""
 
+    __slots__ = ('shop_loc',)
+
     def __init__(self):
         self.shop_loc = None
 
@@ -201,27 +576,25 @@ class BuyPlateCommand(Command):
         bx, by = bot_state['x'], bot_state['y']
 
         if self.shop_loc is None:
-            self.shop_loc = find_tile(controller, "SHOP")
+            self.shop_loc = nearest_tile(controller, "SHOP", (bx, by))
             if not self.shop_loc:
                 return
 
         sx, sy = self.shop_loc
 
-        if max(abs(bx - sx), abs(by - sy)) <= 1:
+        if -1 <= bx - sx <= 1 and -1 <= by - sy <= 1:
             controller.buy(bot_id, ShopCosts.PLATE, sx, sy)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.shop_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.shop_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # holding is a dict with keys: type, dirty, food (list)
-        return holding is not None and holding.get('type') == 'Plate'
+        return holding is not None and holding['type'] == 'Plate'
 
     def __str__(self) -> str:
         return "BuyPlate()"
@@ -230,60 +603,70 @@ class BuyPlateCommand(Command):
 class ChopIngredientCommand(Command):
     """Command: Chop held ingredient on counter."""
 
+    __slots__ = ('counter_loc', 'state')
+
     def __init__(self):
         self.counter_loc = None
-        self.state = "navigating"  # navigating → placing → chopping → picking_up → done
+        self.state = NAVIGATING  # NAVIGATING → PLACING → CHOPPING → PICKING_UP → DONE
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return
 
-        bx, by = bot_state['x'], bot_state['y']
-        holding = bot_state.get('holding')
+        step = self._STEPS.get(self.state)
+        if step:
+            step(self, controller, bot_id, bot_state['x'], bot_state['y'], bot_state.get('holding'))
 
-        if self.state == "navigating":
-            if self.counter_loc is None:
-                self.counter_loc = find_empty_tile(controller, "COUNTER")
-                if not self.counter_loc:
-                    return
+    def _navigate(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        # The counter picked on an earlier turn may have been filled since
+        if self.counter_loc is not None and tile_has_item(controller, self.counter_loc):
+            self.counter_loc = None
+        if self.counter_loc is None:
+            self.counter_loc = find_empty_tile(controller, "COUNTER")
+            if not self.counter_loc:
+                return
+
+        cx, cy = self.counter_loc
+        if not (-1 <= bx - cx <= 1 and -1 <= by - cy <= 1):
+            step_towards(controller, bot_id, (bx, by), self.counter_loc)
+            # Moving doesn't use up the turn's action, so place on arrival
+            bot_state = controller.get_bot_state(bot_id)
+            bx, by = bot_state['x'], bot_state['y']
+        if -1 <= bx - cx <= 1 and -1 <= by - cy <= 1:
+            self.state = PLACING
+            self._place(controller, bot_id, bx, by, holding)
 
+    def _place(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if holding is not None:
             cx, cy = self.counter_loc
-            if max(abs(bx - cx), abs(by - cy)) <= 1:
-                self.state = "placing"
-            else:
-                next_move = bfs_to_adjacent(controller, (bx, by), self.counter_loc)
-                if next_move:
-                    controller.move(bot_id, next_move[0], next_move[1])
+            controller.place(bot_id, cx, cy)
+            self.state = CHOPPING
 
-        elif self.state == "placing":
-            if holding is not None:
-                cx, cy = self.counter_loc
-                controller.place(bot_id, cx, cy)
-                self.state = "chopping"
+    def _chop(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if holding is None:
+            cx, cy = self.counter_loc
+            controller.chop(bot_id, cx, cy)
+            self.state = PICKING_UP
 
-        elif self.state == "chopping":
-            if controller.get_bot_state(bot_id).get('holding') is None:
-                cx, cy = self.counter_loc
-                controller.chop(bot_id, cx, cy)
-                self.state = "picking_up"
+    def _pick_up(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        cx, cy = self.counter_loc
+        controller.pickup(bot_id, cx, cy)
+        self.state = DONE
 
-        elif self.state == "picking_up":
-            cx, cy = self.counter_loc
-            controller.pickup(bot_id, cx, cy)
-            self.state = "done"
+    _STEPS = {NAVIGATING: _navigate, PLACING: _place, CHOPPING: _chop, PICKING_UP: _pick_up}
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
-        if self.state != "done":
+        if self.state != DONE:
             return False
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # Check that we're holding chopped food (dict with chopped=True)
         return (holding is not None and
-                holding.get('type') == 'Food' and
-                holding.get('chopped') == True)
+                holding['type'] == 'Food' and
+                holding['chopped'] == True)
 
     def __str__(self) -> str:
         return "ChopIngredient()"
@@ -292,67 +675,64 @@ class ChopIngredientCommand(Command):
 class CookIngredientCommand(Command):
     """Command: Cook held ingredient on cooker (place in pan, wait for cook, pickup)."""
 
+    __slots__ = ('cooker_loc', 'state')
+
     def __init__(self):
         self.cooker_loc = None
-        self.state = "navigating"  # navigating → placing → cooking → picking_up → done
+        self.state = NAVIGATING  # NAVIGATING → PLACING → COOKING → PICKING_UP → DONE
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return
 
-        bx, by = bot_state['x'], bot_state['y']
-        holding = bot_state.get('holding')
-
-        if self.state == "navigating":
-            if self.cooker_loc is None:
-                self.cooker_loc = find_tile(controller, "COOKER")
-                if not self.cooker_loc:
-                    return
+        step = self._STEPS.get(self.state)
+        if step:
+            step(self, controller, bot_id, bot_state['x'], bot_state['y'], bot_state.get('holding'))
 
-            cx, cy = self.cooker_loc
-            if max(abs(bx - cx), abs(by - cy)) <= 1:
-                self.state = "placing"
-            else:
-                next_move = bfs_to_adjacent(controller, (bx, by), self.cooker_loc)
-                if next_move:
-                    controller.move(bot_id, next_move[0], next_move[1])
+    def _navigate(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if self.cooker_loc is None:
+            self.cooker_loc = find_tile(controller, "COOKER")
+            if not self.cooker_loc:
+                return
 
-        elif self.state == "placing":
-            if holding is not None:
-                cx, cy = self.cooker_loc
-                controller.place(bot_id, cx, cy)
-                self.state = "cooking"
+        cx, cy = self.cooker_loc
+        if -1 <= bx - cx <= 1 and -1 <= by - cy <= 1:
+            self.state = PLACING
+        else:
+            step_towards(controller, bot_id, (bx, by), self.cooker_loc)
 
-        elif self.state == "cooking":
-            # Wait for cooking to complete (cooked_stage == 1, perfectly cooked)
-            # Food is placed in a Pan on the cooker, so we need to check the Pan's food
+    def _place(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if holding is not None:
             cx, cy = self.cooker_loc
-            tile = controller.get_map(controller.get_team()).tiles[cx][cy]
-            item = getattr(tile, "item", None)
+            controller.place(bot_id, cx, cy)
+            self.state = COOKING
 
-            # Check if there's a pan with food cooking
-            if item and item.__class__.__name__ == "Pan":
-                food = getattr(item, "food", None)
-                if food and hasattr(food, "cooked_stage") and food.cooked_stage == 1:
-                    self.state = "picking_up"
+    def _cook(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        # Wait for cooking to complete (cooked_stage == 1, perfectly cooked)
+        # Food is placed in a Pan on the cooker, so we need to check the Pan's food
+        _, cooked_stage = get_turn_pans(controller).get(self.cooker_loc, (None, 0))
+        if cooked_stage == 1:
+            self.state = PICKING_UP
 
-        elif self.state == "picking_up":
-            cx, cy = self.cooker_loc
-            controller.take_from_pan(bot_id, cx, cy)
-            self.state = "done"
+    def _pick_up(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        cx, cy = self.cooker_loc
+        controller.take_from_pan(bot_id, cx, cy)
+        self.state = DONE
+
+    _STEPS = {NAVIGATING: _navigate, PLACING: _place, COOKING: _cook, PICKING_UP: _pick_up}
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
-        if self.state != "done":
+        if self.state != DONE:
             return False
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # Check for properly cooked food (cooked_stage == 1)
         return (holding is not None and
-                holding.get('type') == 'Food' and
-                holding.get('cooked_stage') == 1)
+                holding['type'] == 'Food' and
+                holding['cooked_stage'] == 1)
 
     def __str__(self) -> str:
         return "CookIngredient()"
@@ -361,41 +741,49 @@ class CookIngredientCommand(Command):
 class StartCookingCommand(Command):
     """Command: Start cooking held ingredient (navigate to cooker and place in pan)."""
 
+    __slots__ = ('cooker_loc', 'state')
+
     def __init__(self):
         self.cooker_loc = None
-        self.state = "navigating"  # navigating → placing → done
+        self.state = NAVIGATING  # NAVIGATING → PLACING → DONE
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return
 
-        bx, by = bot_state['x'], bot_state['y']
-        holding = bot_state.get('holding')
+        step = self._STEPS.get(self.state)
+        if step:
+            step(self, controller, bot_id, bot_state['x'], bot_state['y'], bot_state.get('holding'))
+
+    def _navigate(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if self.cooker_loc is None:
+            # Another ingredient may already be cooking, so wait for an empty pan
+            self.cooker_loc = find_free_cooker(controller)
+            if not self.cooker_loc:
+                return
 
-        if self.state == "navigating":
-            if self.cooker_loc is None:
-                self.cooker_loc = find_tile(controller, "COOKER")
-                if not self.cooker_loc:
-                    return
+        cx, cy = self.cooker_loc
+        if -1 <= bx - cx <= 1 and -1 <= by - cy <= 1:
+            self.state = PLACING
+        else:
+            step_towards(controller, bot_id, (bx, by), self.cooker_loc)
 
+    def _place(self, controller: RobotController, bot_id: int, bx: int, by: int, holding) -> None:
+        if holding is not None:
             cx, cy = self.cooker_loc
-            if max(abs(bx - cx), abs(by - cy)) <= 1:
-                self.state = "placing"
+            if controller.place(bot_id, cx, cy):
+                self.state = DONE
             else:
-                next_move = bfs_to_adjacent(controller, (bx, by), self.cooker_loc)
-                if next_move:
-                    controller.move(bot_id, next_move[0], next_move[1])
+                # The pan was taken or filled meanwhile; find another one
+                self.cooker_loc = None
+                self.state = NAVIGATING
 
-        elif self.state == "placing":
-            if holding is not None:
-                cx, cy = self.cooker_loc
-                controller.place(bot_id, cx, cy)
-                self.state = "done"
+    _STEPS = {NAVIGATING: _navigate, PLACING: _place}
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         # Complete once we've placed food in cooker
-        return self.state == "done"
+        return self.state == DONE
 
     def __str__(self) -> str:
         return "StartCooking()"
@@ -404,75 +792,68 @@ class StartCookingCommand(Command):
 class FinishCookingCommand(Command):
     """Command: Pick up cooked food from cooker when ready."""
 
+    __slots__ = ('food_type', 'food_name', 'cooker_loc', 'state')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
+        self.food_name = food_type.name
         self.cooker_loc = None
-        self.state = "waiting"  # waiting → navigating → picking_up → done
+        self.state = WAITING  # WAITING → NAVIGATING → PICKING_UP → DONE
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return
 
-        bx, by = bot_state['x'], bot_state['y']
+        step = self._STEPS.get(self.state)
+        if step:
+            step(self, controller, bot_id, bot_state['x'], bot_state['y'])
 
-        if self.state == "waiting":
-            # Find cooker with our food
-            if self.cooker_loc is None:
-                self.cooker_loc = self._find_cooker_with_food(controller)
-                if not self.cooker_loc:
-                    return
+    def _wait(self, controller: RobotController, bot_id: int, bx: int, by: int) -> None:
+        # Find cooker with our food
+        if self.cooker_loc is None:
+            self.cooker_loc = self._find_cooker_with_food(controller)
+            if not self.cooker_loc:
+                return
 
-            # Check if food is cooked (stage == 1: perfectly cooked, not burnt)
-            cx, cy = self.cooker_loc
-            tile = controller.get_map(controller.get_team()).tiles[cx][cy]
-            item = getattr(tile, "item", None)
+        # Check if food is cooked (stage == 1: perfectly cooked, not burnt)
+        # If >= 2, the food burned while we were doing other tasks
+        _, cooked_stage = get_turn_pans(controller).get(self.cooker_loc, (None, 0))
+        if cooked_stage == 1:
+            self.state = NAVIGATING
 
-            if item and item.__class__.__name__ == "Pan":
-                food = getattr(item, "food", None)
-                # Only pick up when cooked_stage == 1 (perfectly cooked)
-                # If >= 2, the food burned while we were doing other tasks
-                if food and hasattr(food, "cooked_stage") and food.cooked_stage == 1:
-                    self.state = "navigating"
+    def _navigate(self, controller: RobotController, bot_id: int, bx: int, by: int) -> None:
+        cx, cy = self.cooker_loc
+        if -1 <= bx - cx <= 1 and -1 <= by - cy <= 1:
+            self.state = PICKING_UP
+        else:
+            step_towards(controller, bot_id, (bx, by), self.cooker_loc)
 
-        elif self.state == "navigating":
-            cx, cy = self.cooker_loc
-            if max(abs(bx - cx), abs(by - cy)) <= 1:
-                self.state = "picking_up"
-            else:
-                next_move = bfs_to_adjacent(controller, (bx, by), self.cooker_loc)
-                if next_move:
-                    controller.move(bot_id, next_move[0], next_move[1])
+    def _pick_up(self, controller: RobotController, bot_id: int, bx: int, by: int) -> None:
+        cx, cy = self.cooker_loc
+        controller.take_from_pan(bot_id, cx, cy)
+        self.state = DONE
 
-        elif self.state == "picking_up":
-            cx, cy = self.cooker_loc
-            controller.take_from_pan(bot_id, cx, cy)
-            self.state = "done"
+    _STEPS = {WAITING: _wait, NAVIGATING: _navigate, PICKING_UP: _pick_up}
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
-        if self.state != "done":
+        if self.state != DONE:
             return False
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # Check for properly cooked food (cooked_stage == 1)
         return (holding is not None and
-                holding.get('type') == 'Food' and
-                holding.get('cooked_stage') == 1)
+                holding['type'] == 'Food' and
+                holding['cooked_stage'] == 1)
 
     def _find_cooker_with_food(self, controller: RobotController) -> Optional[Tuple[int, int]]:
         """Find cooker with our food type cooking."""
-        m = controller.get_map(controller.get_team())
-        for x in range(m.width):
-            for y in range(m.height):
-                tile = m.tiles[x][y]
-                if tile.tile_name == "COOKER":
-                    item = getattr(tile, "item", None)
-                    if item and item.__class__.__name__ == "Pan":
-                        food = getattr(item, "food", None)
-                        if food and hasattr(food, 'food_name') and food.food_name == self.food_type.name:
-                            return (x, y)
+        food_name = self.food_name
+        for loc, (pan_food, _) in get_turn_pans(controller).items():
+            if pan_food == food_name:
+                return loc
         return None
 
     def __str__(self) -> str:
@@ -487,6 +868,8 @@ class StoreInBoxCommand(Command):
     This command tries to find an appropriate box (empty or matching item type).
     """
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -505,40 +888,31 @@ class StoreInBoxCommand(Command):
             # Find a suitable box: either empty or containing the same food type
             holding_food_name = holding.get('food_name') if holding and holding.get('type') == 'Food' else None
 
-            m = controller.get_map(controller.get_team())
-            for x in range(m.width):
-                for y in range(m.height):
-                    tile = m.tiles[x][y]
-                    if tile.tile_name == "BOX":
-                        item = getattr(tile, "item", None)
-                        # Accept if empty or if it contains the same food type
-                        if item is None:
-                            self.box_loc = (x, y)
-                            break
-                        elif hasattr(item, 'food_name') and item.food_name == holding_food_name:
-                            self.box_loc = (x, y)
-                            break
-                if self.box_loc:
-                    break
+            tiles = get_turn_map(controller).tiles
+            boxes = []
+            for x, y in get_tile_index(controller).get("BOX", ()):
+                item = getattr(tiles[x][y], "item", None)
+                # Accept if empty or if it contains the same food type
+                if item is None or (hasattr(item, 'food_name') and item.food_name == holding_food_name):
+                    boxes.append((x, y))
+            self.box_loc = closest_tile(controller, (bx, by), boxes)
 
             if not self.box_loc:
                 return
 
         box_x, box_y = self.box_loc
 
-        if max(abs(bx - box_x), abs(by - box_y)) <= 1:
+        if -1 <= bx - box_x <= 1 and -1 <= by - box_y <= 1:
             controller.place(bot_id, box_x, box_y)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.box_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.box_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         return holding is None
 
     def __str__(self) -> str:
@@ -548,6 +922,8 @@ class StoreInBoxCommand(Command):
 class PlaceOnCounterCommand(Command):
     """Command: Place held item on counter."""
 
+    __slots__ = ('counter_loc',)
+
     def __init__(self):
         self.counter_loc = None
 
@@ -562,6 +938,8 @@ class PlaceOnCounterCommand(Command):
         if holding is None:
             return
 
+        if self.counter_loc is not None and tile_has_item(controller, self.counter_loc):
+            self.counter_loc = None
         if self.counter_loc is None:
             self.counter_loc = find_empty_tile(controller, "COUNTER")
             if not self.counter_loc:
@@ -569,19 +947,17 @@ class PlaceOnCounterCommand(Command):
 
         cx, cy = self.counter_loc
 
-        if max(abs(bx - cx), abs(by - cy)) <= 1:
+        if -1 <= bx - cx <= 1 and -1 <= by - cy <= 1:
             controller.place(bot_id, cx, cy)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.counter_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.counter_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        return bot_state.get('holding') is None
+        return bot_state['holding'] is None
 
     def __str__(self) -> str:
         return "PlaceOnCounter()"
@@ -590,8 +966,11 @@ class PlaceOnCounterCommand(Command):
 class PickupFromBoxCommand(Command):
     """Command: Pick up specific food type from box."""
 
+    __slots__ = ('food_type', 'food_name', 'box_loc')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
+        self.food_name = food_type.name
         self.box_loc = None
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
@@ -607,30 +986,29 @@ class PickupFromBoxCommand(Command):
 
         if self.box_loc is None:
             # Find box with our food
+            food_name = self.food_name
             self.box_loc = find_item_on_tile(
                 controller,
                 "BOX",
-                lambda item: hasattr(item, 'food_name') and item.food_name == self.food_type.name
+                lambda item: hasattr(item, 'food_name') and item.food_name == food_name
             )
             if not self.box_loc:
                 return
 
         fx, fy = self.box_loc
 
-        if max(abs(bx - fx), abs(by - fy)) <= 1:
+        if -1 <= bx - fx <= 1 and -1 <= by - fy <= 1:
             controller.pickup(bot_id, fx, fy)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.box_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.box_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
-        return holding and hasattr(holding, 'food_name') and holding.food_name == self.food_type.name
+        holding = bot_state['holding']
+        return holding and hasattr(holding, 'food_name') and holding.food_name == self.food_name
 
     def __str__(self) -> str:
         return f"PickupFromBox({self.food_type.name})"
@@ -639,6 +1017,8 @@ class PickupFromBoxCommand(Command):
 class PickupPlateFromCounterCommand(Command):
     """Command: Pick up plate from counter."""
 
+    __slots__ = ('plate_loc',)
+
     def __init__(self):
         self.plate_loc = None
 
@@ -653,39 +1033,28 @@ class PickupPlateFromCounterCommand(Command):
         if holding is not None:
             return
 
-        if self.plate_loc is None:
-            # Find plate on counter (item is actual object, not dict)
-            m = controller.get_map(controller.get_team())
-            for x in range(m.width):
-                for y in range(m.height):
-                    tile = m.tiles[x][y]
-                    if tile.tile_name == "COUNTER":
-                        item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
-                            self.plate_loc = (x, y)
-                            break
-                if self.plate_loc:
-                    break
+        plates = get_turn_items(controller).get(("COUNTER", Plate), [])
+        if self.plate_loc not in plates:
+            # Find plate on counter (again, if it has moved since)
+            self.plate_loc = closest_tile(controller, (bx, by), plates)
             if not self.plate_loc:
                 return
 
         px, py = self.plate_loc
 
-        if max(abs(bx - px), abs(by - py)) <= 1:
+        if -1 <= bx - px <= 1 and -1 <= by - py <= 1:
             controller.pickup(bot_id, px, py)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.plate_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.plate_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # holding is a dict
-        return holding is not None and holding.get('type') == 'Plate'
+        return holding is not None and holding['type'] == 'Plate'
 
     def __str__(self) -> str:
         return "PickupPlateFromCounter()"
@@ -694,6 +1063,8 @@ class PickupPlateFromCounterCommand(Command):
 class PlaceInBoxCommand(Command):
     """Command: Place held item (plate or food) in a box."""
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -710,43 +1081,33 @@ class PlaceInBoxCommand(Command):
 
         if self.box_loc is None:
             # Find a suitable box: either empty or containing the same item type
-            holding_type = holding.get('type') if isinstance(holding, dict) else holding.__class__.__name__
-
-            m = controller.get_map(controller.get_team())
-            for x in range(m.width):
-                for y in range(m.height):
-                    tile = m.tiles[x][y]
-                    if tile.tile_name == "BOX":
-                        item = getattr(tile, "item", None)
-                        # Accept if empty
-                        if item is None:
-                            self.box_loc = (x, y)
-                            break
-                        # Accept if it contains the same type (Plate or specific food)
-                        elif item.__class__.__name__ == holding_type:
-                            self.box_loc = (x, y)
-                            break
-                if self.box_loc:
-                    break
+            holding_cls = ITEM_CLASSES.get(holding['type'])
+
+            tiles = get_turn_map(controller).tiles
+            boxes = []
+            for x, y in get_tile_index(controller).get("BOX", ()):
+                item = getattr(tiles[x][y], "item", None)
+                # Accept if empty, or if it contains the same type (Plate or specific food)
+                if item is None or type(item) is holding_cls:
+                    boxes.append((x, y))
+            self.box_loc = closest_tile(controller, (bx, by), boxes)
 
             if not self.box_loc:
                 return
 
         box_x, box_y = self.box_loc
 
-        if max(abs(bx - box_x), abs(by - box_y)) <= 1:
+        if -1 <= bx - box_x <= 1 and -1 <= by - box_y <= 1:
             controller.place(bot_id, box_x, box_y)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.box_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.box_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         return holding is None
 
     def __str__(self) -> str:
@@ -756,6 +1117,8 @@ class PlaceInBoxCommand(Command):
 class PickupPlateFromBoxCommand(Command):
     """Command: Pick up plate from box."""
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -770,39 +1133,28 @@ class PickupPlateFromBoxCommand(Command):
         if holding is not None:
             return
 
-        if self.box_loc is None:
-            # Find box with plate
-            m = controller.get_map(controller.get_team())
-            for x in range(m.width):
-                for y in range(m.height):
-                    tile = m.tiles[x][y]
-                    if tile.tile_name == "BOX":
-                        item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
-                            self.box_loc = (x, y)
-                            break
-                if self.box_loc:
-                    break
+        plates = get_turn_items(controller).get(("BOX", Plate), [])
+        if self.box_loc not in plates:
+            # Find box with plate (again, if it has been emptied since)
+            self.box_loc = closest_tile(controller, (bx, by), plates)
             if not self.box_loc:
                 return
 
         px, py = self.box_loc
 
-        if max(abs(bx - px), abs(by - py)) <= 1:
+        if -1 <= bx - px <= 1 and -1 <= by - py <= 1:
             controller.pickup(bot_id, px, py)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.box_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.box_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
-        holding = bot_state.get('holding')
+        holding = bot_state['holding']
         # holding is a dict
-        return holding is not None and holding.get('type') == 'Plate'
+        return holding is not None and holding['type'] == 'Plate'
 
     def __str__(self) -> str:
         return "PickupPlateFromBox()"
@@ -811,49 +1163,56 @@ class PickupPlateFromBoxCommand(Command):
 class AddFoodToPlateCommand(Command):
     """Command: Add food from counter to held plate."""
 
+    __slots__ = ('food_type', 'food_name', 'food_loc', 'state')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
+        self.food_name = food_type.name
         self.food_loc = None
-        self.state = "navigating"
+        self.state = NAVIGATING  # NAVIGATING → ADDING → DONE
 
     def execute(self, controller: RobotController, bot_id: int) -> None:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return
 
-        bx, by = bot_state['x'], bot_state['y']
         holding = bot_state.get('holding')
 
         # holding is a dict
         if holding is None or holding.get('type') != 'Plate':
             return
 
-        if self.state == "navigating":
-            if self.food_loc is None:
-                # Find food on counter
-                self.food_loc = find_item_on_tile(
-                    controller,
-                    "COUNTER",
-                    lambda item: hasattr(item, 'food_name') and item.food_name == self.food_type.name
-                )
-                if not self.food_loc:
-                    return
-
-            fx, fy = self.food_loc
-            if max(abs(bx - fx), abs(by - fy)) <= 1:
-                self.state = "adding"
-            else:
-                next_move = bfs_to_adjacent(controller, (bx, by), self.food_loc)
-                if next_move:
-                    controller.move(bot_id, next_move[0], next_move[1])
+        step = self._STEPS.get(self.state)
+        if step:
+            step(self, controller, bot_id, bot_state['x'], bot_state['y'])
+
+    def _navigate(self, controller: RobotController, bot_id: int, bx: int, by: int) -> None:
+        if self.food_loc is None:
+            # Find food on counter
+            food_name = self.food_name
+            self.food_loc = find_item_on_tile(
+                controller,
+                "COUNTER",
+                lambda item: hasattr(item, 'food_name') and item.food_name == food_name
+            )
+            if not self.food_loc:
+                return
+
+        fx, fy = self.food_loc
+        if -1 <= bx - fx <= 1 and -1 <= by - fy <= 1:
+            self.state = ADDING
+        else:
+            step_towards(controller, bot_id, (bx, by), self.food_loc)
+
+    def _add(self, controller: RobotController, bot_id: int, bx: int, by: int) -> None:
+        fx, fy = self.food_loc
+        controller.add_food_to_plate(bot_id, fx, fy)
+        self.state = DONE
 
-        elif self.state == "adding":
-            fx, fy = self.food_loc
-            controller.add_food_to_plate(bot_id, fx, fy)
-            self.state = "done"
+    _STEPS = {NAVIGATING: _navigate, ADDING: _add}
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
-        return self.state == "done"
+        return self.state == DONE
 
     def __str__(self) -> str:
         return f"AddFoodToPlate({self.food_type.name})"
@@ -862,6 +1221,8 @@ class AddFoodToPlateCommand(Command):
 class SubmitOrderCommand(Command):
     """Command: Submit completed plate at submit station."""
 
+    __slots__ = ('order_id', 'submit_loc')
+
     def __init__(self, order_id: int = None):
         self.order_id = order_id  # Keep for reference, but not used in submit()
         self.submit_loc = None
@@ -875,38 +1236,63 @@ class SubmitOrderCommand(Command):
         holding = bot_state.get('holding')
 
         if self.submit_loc is None:
-            self.submit_loc = find_tile(controller, "SUBMIT")
+            self.submit_loc = nearest_tile(controller, "SUBMIT", (bx, by))
             if not self.submit_loc:
                 return
 
         sx, sy = self.submit_loc
 
-        if max(abs(bx - sx), abs(by - sy)) <= 1:
+        if -1 <= bx - sx <= 1 and -1 <= by - sy <= 1:
             # holding is a dict
             if holding and holding.get('type') == 'Plate':
                 # submit() automatically matches plate to orders
                 controller.submit(bot_id, sx, sy)
             return
 
-        next_move = bfs_to_adjacent(controller, (bx, by), self.submit_loc)
-        if next_move:
-            controller.move(bot_id, next_move[0], next_move[1])
+        step_towards(controller, bot_id, (bx, by), self.submit_loc)
 
     def is_complete(self, controller: RobotController, bot_id: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         if not bot_state:
             return False
         # Submission complete when we're no longer holding the plate
-        return bot_state.get('holding') is None
+        return bot_state['holding'] is None
 
     def __str__(self) -> str:
         return f"SubmitOrder(order_id={self.order_id})"
 
 
+class EndOfQueueCommand(Command):
+    """Sentinel kept at the end of every command queue; does nothing."""
+
+    __slots__ = ()
+
+    def execute(self, controller: RobotController, bot_id: int) -> None:
+        pass
+
+    def is_complete(self, controller: RobotController, bot_id: int) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return "EndOfQueue"
+
+
+# Shared sentinel, so "queue finished" is an identity check on the current command
+END_OF_QUEUE = EndOfQueueCommand()
+
+
 # ============================================================================
 # RECIPE PLANNER
 # ============================================================================
 
+# Order ingredient names we know how to make -> their FoodType members
+FOOD_BY_NAME = FoodType.__members__
+
+# Most ingredients one order leaves cooking at once. Food stays cooked for 20
+# turns before burning, which covers collecting and plating about two pans.
+MAX_PARALLEL_COOKS = 2
+
+
 class RecipePlanner:
     """
     Converts orders into command sequences.
@@ -931,13 +1317,39 @@ class RecipePlanner:
     @staticmethod
     def count_tiles(controller: RobotController, tile_name: str) -> int:
         """Count number of tiles of a given type on the map."""
-        m = controller.get_map(controller.get_team())
-        count = 0
-        for x in range(m.width):
-            for y in range(m.height):
-                if m.tiles[x][y].tile_name == tile_name:
-                    count += 1
-        return count
+        return len(get_tile_index(controller).get(tile_name, ()))
+
+    # tuple(required) -> (required_foods, cooking_foods, non_cooking_foods) for classify()
+    _classified: Dict = {}
+
+    @staticmethod
+    def classify(required: List[str]) -> Tuple[List[FoodType], List[FoodType], List[FoodType]]:
+        """
+        Parse an order's ingredient names and split them by whether they cook.
+
+        Done in one pass and cached per ingredient list, since triage and
+        planning both ask about the same orders turn after turn. Callers must
+        not mutate the returned lists.
+        """
+        key = tuple(required)
+        classified = RecipePlanner._classified.get(key)
+        if classified is None:
+            required_foods = []
+            cooking_foods = []
+            non_cooking_foods = []
+            for food_name in key:
+                food_type = FOOD_BY_NAME.get(food_name)
+                if food_type is None:
+                    log.warning("[WARN] Unknown food type: %s", food_name)
+                    continue
+                required_foods.append(food_type)
+                if RecipePlanner.needs_cooking(food_type):
+                    cooking_foods.append(food_type)
+                else:
+                    non_cooking_foods.append(food_type)
+            classified = (required_foods, cooking_foods, non_cooking_foods)
+            RecipePlanner._classified[key] = classified
+        return classified
 
     @staticmethod
     def build_commands_for_order(order: Dict, controller: RobotController = None) -> List[Command]:
@@ -961,59 +1373,85 @@ class RecipePlanner:
         Returns:
             List of commands to execute in sequence
         """
-        commands = []
-
         # Parse required foods
-        required_foods = []
-        for food_name in order["required"]:
-            try:
-                required_foods.append(FoodType[food_name])
-            except KeyError:
-                print(f"[WARN] Unknown food type: {food_name}")
-                continue
-
-        # Separate into cooking and non-cooking ingredients
-        cooking_foods = [f for f in required_foods if RecipePlanner.needs_cooking(f)]
-        non_cooking_foods = [f for f in required_foods if not RecipePlanner.needs_cooking(f)]
+        required_foods, cooking_foods, _ = RecipePlanner.classify(order["required"])
 
         # Detect if we have limited counters (1 counter scenario)
         use_box_for_plate = False
+        parallel = 1
         if controller is not None:
             counter_count = RecipePlanner.count_tiles(controller, "COUNTER")
             box_count = RecipePlanner.count_tiles(controller, "BOX")
             # If only 1 counter and at least 1 box, use box for plate storage
             if counter_count == 1 and box_count >= 1:
                 use_box_for_plate = True
-                print(f"[BOT] Detected 1 counter + {box_count} box(es) - using box for plate storage")
+                log.debug("[BOT] Detected 1 counter + %d box(es) - using box for plate storage", box_count)
+            if cooking_foods:
+                cooker_count = RecipePlanner.count_tiles(controller, "COOKER")
+                parallel = max(1, min(cooker_count, MAX_PARALLEL_COOKS))
+
+        # The plan only depends on the order's shape, so it is built once per
+        # shape and then filled in with this order's ingredients
+        shape = (use_box_for_plate, parallel,
+                 tuple((RecipePlanner.needs_chopping(f), RecipePlanner.needs_cooking(f)) for f in required_foods))
+        template = RecipePlanner._templates.get(shape)
+        if template is None:
+            template = RecipePlanner.plan_template(*shape)
+            RecipePlanner._templates[shape] = template
+
+        commands = [command() if slot is None else command(required_foods[slot]) for command, slot in template]
+        commands.append(SubmitOrderCommand(order["order_id"]))
+        return commands
+
+    # (use_box_for_plate, parallel, ((can_chop, can_cook), ...)) -> plan_template() result
+    _templates: Dict = {}
+
+    @staticmethod
+    def plan_template(use_box_for_plate: bool, parallel: int,
+                      foods: Tuple[Tuple[bool, bool], ...]) -> Tuple[Tuple[type, Optional[int]], ...]:
+        """
+        Lay out the command sequence for an order of a given shape.
+
+        foods holds (needs chopping, needs cooking) per required ingredient.
+        Each step is (command class, ingredient slot); the slot indexes the
+        order's required foods, or is None for commands built without one.
+        The final SubmitOrderCommand is left to the caller.
+        """
+        commands = []
+        cooking_foods = [i for i, (_, cook) in enumerate(foods) if cook]
+        non_cooking_foods = [i for i, (_, cook) in enumerate(foods) if not cook]
+
+        def needs_chopping(slot: int) -> bool:
+            return foods[slot][0]
 
         # Step 1: Buy plate and place in appropriate location
-        commands.append(BuyPlateCommand())
+        commands.append((BuyPlateCommand, None))
         if use_box_for_plate:
-            commands.append(PlaceInBoxCommand())
+            commands.append((PlaceInBoxCommand, None))
         else:
-            commands.append(PlaceOnCounterCommand())
+            commands.append((PlaceOnCounterCommand, None))
 
         # Helper function to add ingredient to plate (varies based on plate storage location)
-        def add_ingredient_to_plate_sequence(food_type: FoodType) -> List[Command]:
+        def add_ingredient_to_plate_sequence(slot: int) -> List[Tuple[type, Optional[int]]]:
             """Generate command sequence to add an ingredient to the plate."""
             seq = []
             # Place ingredient on counter
-            seq.append(PlaceOnCounterCommand())
+            seq.append((PlaceOnCounterCommand, None))
 
             # Pick up plate from its storage location
             if use_box_for_plate:
-                seq.append(PickupPlateFromBoxCommand())
+                seq.append((PickupPlateFromBoxCommand, None))
             else:
-                seq.append(PickupPlateFromCounterCommand())
+                seq.append((PickupPlateFromCounterCommand, None))
 
             # Add ingredient to plate
-            seq.append(AddFoodToPlateCommand(food_type))
+            seq.append((AddFoodToPlateCommand, slot))
 
             # Place plate back in storage
             if use_box_for_plate:
-                seq.append(PlaceInBoxCommand())
+                seq.append((PlaceInBoxCommand, None))
             else:
-                seq.append(PlaceOnCounterCommand())
+                seq.append((PlaceOnCounterCommand, None))
 
             return seq
 
@@ -1021,78 +1459,87 @@ class RecipePlanner:
         # If using box strategy (1 counter), don't parallelize cooking to avoid burning
         if cooking_foods and not use_box_for_plate:
             # PARALLELIZED COOKING STRATEGY (multiple counters available)
-            # Start with first cooking ingredient
-            first_cooking = cooking_foods[0]
-
-            # Buy and prep first cooking ingredient
-            commands.append(BuyIngredientCommand(first_cooking))
-            if RecipePlanner.needs_chopping(first_cooking):
-                commands.append(ChopIngredientCommand())
-
-            # START cooking (place in cooker but don't wait)
-            commands.append(StartCookingCommand())
+            # Each ingredient is a chain buy → [chop] → [cook] → add to plate, and
+            # the bot can only hold one thing. Cooking is the only step that runs
+            # by itself, so start as many cooking chains as there are free pans
+            # (capped to keep pickups inside the cooked window), fill the wait
+            # with the non-cooking chains, then collect the pans in start order.
+            started = cooking_foods[:parallel]
+
+            # Buy, prep and START cooking (place in cooker but don't wait)
+            for slot in started:
+                commands.append((BuyIngredientCommand, slot))
+                if needs_chopping(slot):
+                    commands.append((ChopIngredientCommand, None))
+                commands.append((StartCookingCommand, None))
 
             # While food is cooking, prepare all non-cooking ingredients and add to plate
-            for food_type in non_cooking_foods:
+            for slot in non_cooking_foods:
                 # Buy ingredient
-                commands.append(BuyIngredientCommand(food_type))
+                commands.append((BuyIngredientCommand, slot))
 
                 # Chop if needed
-                if RecipePlanner.needs_chopping(food_type):
-                    commands.append(ChopIngredientCommand())
+                if needs_chopping(slot):
+                    commands.append((ChopIngredientCommand, None))
 
                 # Add ingredient to plate (sequence varies based on plate storage)
-                commands.extend(add_ingredient_to_plate_sequence(food_type))
-
-            # FINISH cooking - pick up when ready (will wait if not done yet)
-            commands.append(FinishCookingCommand(first_cooking))
+                commands.extend(add_ingredient_to_plate_sequence(slot))
 
-            # Add the cooked ingredient to plate
-            commands.extend(add_ingredient_to_plate_sequence(first_cooking))
+            # FINISH cooking - pick up when ready (will wait if not done yet),
+            # then add the cooked ingredient to plate
+            for slot in started:
+                commands.append((FinishCookingCommand, slot))
+                commands.extend(add_ingredient_to_plate_sequence(slot))
 
             # Process remaining cooking ingredients (if any)
-            for food_type in cooking_foods[1:]:
-                commands.append(BuyIngredientCommand(food_type))
+            for slot in cooking_foods[parallel:]:
+                commands.append((BuyIngredientCommand, slot))
 
-                if RecipePlanner.needs_chopping(food_type):
-                    commands.append(ChopIngredientCommand())
+                if needs_chopping(slot):
+                    commands.append((ChopIngredientCommand, None))
 
-                commands.append(CookIngredientCommand())
+                commands.append((CookIngredientCommand, None))
 
                 # Add to plate
-                commands.extend(add_ingredient_to_plate_sequence(food_type))
+                commands.extend(add_ingredient_to_plate_sequence(slot))
         else:
             # SEQUENTIAL STRATEGY (1 counter or no cooking ingredients)
             # Process all ingredients sequentially without parallelizing
-            for food_type in required_foods:
+            for slot, (chop, cook) in enumerate(foods):
                 # Buy ingredient
-                commands.append(BuyIngredientCommand(food_type))
+                commands.append((BuyIngredientCommand, slot))
 
                 # Chop if needed
-                if RecipePlanner.needs_chopping(food_type):
-                    commands.append(ChopIngredientCommand())
+                if chop:
+                    commands.append((ChopIngredientCommand, None))
 
                 # Cook if needed (wait for completion before continuing)
-                if RecipePlanner.needs_cooking(food_type):
-                    commands.append(CookIngredientCommand())
+                if cook:
+                    commands.append((CookIngredientCommand, None))
 
                 # Add to plate
-                commands.extend(add_ingredient_to_plate_sequence(food_type))
+                commands.extend(add_ingredient_to_plate_sequence(slot))
 
-        # Step 3: Pick up completed plate and submit
+        # Step 3: Pick up completed plate (the caller appends the submit)
         if use_box_for_plate:
-            commands.append(PickupPlateFromBoxCommand())
+            commands.append((PickupPlateFromBoxCommand, None))
         else:
-            commands.append(PickupPlateFromCounterCommand())
-        commands.append(SubmitOrderCommand(order["order_id"]))
+            commands.append((PickupPlateFromCounterCommand, None))
 
-        return commands
+        return tuple(commands)
 
 
 # ============================================================================
 # BOT IMPLEMENTATION
 # ============================================================================
 
+# Held items that cleanup puts back down (everything else is trashed)
+KEEP_HOLDING_TYPES = frozenset({'Plate', 'Pan'})
+
+# Surfaces cleanup clears of leftover Food
+CLEANUP_TILES = frozenset({"COUNTER", "BOX"})
+
+
 class BotPlayer:
     """
     Command-based bot that uses a command queue to fulfill orders.
@@ -1100,25 +1547,57 @@ class BotPlayer:
 
     def __init__(self, map_copy):
         self.map = map_copy
-        self.command_queue: List[Command] = []
+        self.command_queue: List[Command] = [END_OF_QUEUE]
         self.current_command_index = 0
-        self.processed_orders = set()
+        self.processed_orders = bytearray(64)  # order_id -> 1 once handled (ids count up from 1)
+        self.order_meta: Dict[int, Tuple[bool, int, int, int]] = {}  # order_id -> triage sizing, see play_turn
         self.current_order_id = None  # Track which order we're currently working on
         self.cleaning_workspace = False  # Track if we're cleaning up after expired order
 
-    def get_current_command(self) -> Optional[Command]:
-        """Get currently active command."""
-        if self.current_command_index >= len(self.command_queue):
-            return None
+    def get_current_command(self) -> Command:
+        """Get currently active command (END_OF_QUEUE once the queue is done)."""
         return self.command_queue[self.current_command_index]
 
     def advance_command(self) -> None:
         """Move to next command."""
         self.current_command_index += 1
 
+    def is_processed(self, order_id: int) -> bool:
+        """Whether we already took or ruled out this order."""
+        return order_id < len(self.processed_orders) and self.processed_orders[order_id] == 1
+
+    def mark_processed(self, order_id: int) -> None:
+        """Remember that this order was taken or ruled out."""
+        flags = self.processed_orders
+        if order_id >= len(flags):
+            # Grow geometrically so a long game only reallocates a few times
+            flags.extend(bytes(max(order_id + 1, 2 * len(flags)) - len(flags)))
+        flags[order_id] = 1
+        self.order_meta.pop(order_id, None)  # never triaged again
+
+    @staticmethod
+    def act_at(controller: RobotController, bot_id: int, pos: Tuple[int, int], target: Tuple[int, int], action) -> bool:
+        """
+        Run action(bot_id, x, y) on target if we are next to it, else step toward it.
+
+        Returns whether the action was issued. Steps come from the target's
+        cached distance field (see goal_field), so walking there costs a few
+        lookups per turn rather than a fresh search.
+        """
+        tx, ty = target
+        if -1 <= pos[0] - tx <= 1 and -1 <= pos[1] - ty <= 1:
+            action(bot_id, tx, ty)
+            return True
+        step_towards(controller, bot_id, pos, target)
+        return False
+
     def play_turn(self, controller: RobotController):
         """Main bot logic - called each turn."""
-        bots = controller.get_team_bot_ids(controller.get_team())
+        # Fetched once; every branch below works within this one turn
+        team = controller.get_team()
+        turn = controller.get_turn()
+
+        bots = controller.get_team_bot_ids(team)
         if not bots:
             return
 
@@ -1126,14 +1605,14 @@ class BotPlayer:
 
         # Check if current order is still active (hasn't expired)
         if self.current_order_id is not None:
-            orders = controller.get_orders(controller.get_team())
+            orders = controller.get_orders(team)
             order_still_active = any(o["order_id"] == self.current_order_id and o["is_active"] for o in orders)
 
             if not order_still_active:
-                print(f"[BOT] Turn {controller.get_turn()}: Order {self.current_order_id} expired, clearing workspace")
+                log.debug("[BOT] Turn %d: Order %s expired, clearing workspace", turn, self.current_order_id)
 
                 # Clear command queue and enter cleanup mode
-                self.command_queue = []
+                self.command_queue = [END_OF_QUEUE]
                 self.current_command_index = 0
                 self.current_order_id = None
                 self.cleaning_workspace = True  # Enter cleanup mode
@@ -1153,7 +1632,7 @@ class BotPlayer:
             if holding is not None:
                 holding_type = holding.get('type') if isinstance(holding, dict) else 'unknown'
 
-                if holding_type in ['Plate', 'Pan']:
+                if holding_type in KEEP_HOLDING_TYPES:
                     # Place plate/pan: Pans go to cookers, Plates go to boxes (to keep counters clear)
                     if holding_type == 'Pan':
                         target_loc = find_tile(controller, "COOKER")
@@ -1164,67 +1643,42 @@ class BotPlayer:
                             target_loc = find_tile(controller, "COUNTER")
 
                     if target_loc:
-                        cx, cy = target_loc
-                        if max(abs(bx - cx), abs(by - cy)) <= 1:
-                            controller.place(bot_id, cx, cy)
-                            print(f"[BOT] Placed {holding_type} during cleanup")
-                            return
-                        else:
-                            next_move = bfs_to_adjacent(controller, (bx, by), target_loc)
-                            if next_move:
-                                controller.move(bot_id, next_move[0], next_move[1])
-                            return
+                        if self.act_at(controller, bot_id, (bx, by), target_loc, controller.place):
+                            log.debug("[BOT] Placed %s during cleanup", holding_type)
+                        return
                 else:
                     # Trash food items
-                    trash_loc = find_tile(controller, "TRASH")
+                    trash_loc = nearest_tile(controller, "TRASH", (bx, by))
                     if trash_loc:
-                        tx, ty = trash_loc
-                        if max(abs(bx - tx), abs(by - ty)) <= 1:
-                            controller.trash(bot_id, tx, ty)
-                            print(f"[BOT] Trashed {holding_type} during cleanup")
-                            return
-                        else:
-                            next_move = bfs_to_adjacent(controller, (bx, by), trash_loc)
-                            if next_move:
-                                controller.move(bot_id, next_move[0], next_move[1])
-                            return
+                        if self.act_at(controller, bot_id, (bx, by), trash_loc, controller.trash):
+                            log.debug("[BOT] Trashed %s during cleanup", holding_type)
+                        return
 
             # Hands are empty, clean up Food items from counters (leave Plates, they don't block much)
-            m = controller.get_map(controller.get_team())
+            items = get_turn_items(controller)
             cleanup_target = None
+            cleanup_tile = None
 
-            for x in range(m.width):
-                for y in range(m.height):
-                    tile = m.tiles[x][y]
-                    if tile.tile_name in ["COUNTER", "BOX"]:
-                        item = getattr(tile, "item", None)
-                        # Only pick up Food items, skip Plates
-                        if item is not None and item.__class__.__name__ == "Food":
-                            cleanup_target = (x, y)
-                            break
-                if cleanup_target:
-                    break
+            # First Food in column-major scan order across the cleanup surfaces
+            for tile_name in CLEANUP_TILES:
+                locs = items.get((tile_name, Food))
+                if locs and (cleanup_target is None or locs[0] < cleanup_target):
+                    cleanup_target = locs[0]
+                    cleanup_tile = tile_name
 
             if cleanup_target:
-                cx, cy = cleanup_target
-                if max(abs(bx - cx), abs(by - cy)) <= 1:
-                    controller.pickup(bot_id, cx, cy)
-                    print(f"[BOT] Picked up Food from {m.tiles[cx][cy].tile_name} to clear workspace")
-                    return
-                else:
-                    next_move = bfs_to_adjacent(controller, (bx, by), cleanup_target)
-                    if next_move:
-                        controller.move(bot_id, next_move[0], next_move[1])
-                    return
+                if self.act_at(controller, bot_id, (bx, by), cleanup_target, controller.pickup):
+                    log.debug("[BOT] Picked up Food from %s to clear workspace", cleanup_tile)
+                return
 
             # Workspace is clean (Plates may remain but they can coexist with new items)
-            print(f"[BOT] Workspace cleared, ready for new orders")
+            log.debug("[BOT] Workspace cleared, ready for new orders")
             self.cleaning_workspace = False
             return
 
         # If no commands, check for new orders
         # BUT: only if bot has empty hands (don't start new orders while holding items from expired orders)
-        if not self.command_queue or self.current_command_index >= len(self.command_queue):
+        if self.command_queue[self.current_command_index] is END_OF_QUEUE:
             bot_state = controller.get_bot_state(bot_id)
             if bot_state and bot_state.get('holding') is not None:
                 # Still holding something from a previous order, need to get rid of it
@@ -1233,80 +1687,70 @@ class BotPlayer:
 
                 # If holding a plate, try to place it somewhere (trash makes it dirty but doesn't remove it)
                 if holding_type == 'Plate':
-                    print(f"[BOT] Holding plate, will place on counter/box to clear hands")
+                    log.debug("[BOT] Holding plate, will place on counter/box to clear hands")
                     # Find any counter or box to dump the plate
                     target_loc = find_tile(controller, "COUNTER")
                     if not target_loc:
                         target_loc = find_tile(controller, "BOX")
 
                     if target_loc:
-                        cx, cy = target_loc
                         bx, by = bot_state['x'], bot_state['y']
-
-                        if max(abs(bx - cx), abs(by - cy)) <= 1:
-                            controller.place(bot_id, cx, cy)
-                            print(f"[BOT] Placed plate, hands now free")
-                        else:
-                            next_move = bfs_to_adjacent(controller, (bx, by), target_loc)
-                            if next_move:
-                                controller.move(bot_id, next_move[0], next_move[1])
+                        if self.act_at(controller, bot_id, (bx, by), target_loc, controller.place):
+                            log.debug("[BOT] Placed plate, hands now free")
                 else:
                     # For non-plate items (food), trash them
-                    print(f"[BOT] Holding {holding_type}, navigating to trash")
-                    trash_loc = find_tile(controller, "TRASH")
+                    log.debug("[BOT] Holding %s, navigating to trash", holding_type)
+                    bx, by = bot_state['x'], bot_state['y']
+                    trash_loc = nearest_tile(controller, "TRASH", (bx, by))
                     if trash_loc:
-                        tx, ty = trash_loc
-                        bx, by = bot_state['x'], bot_state['y']
-
-                        if max(abs(bx - tx), abs(by - ty)) <= 1:
-                            controller.trash(bot_id, tx, ty)
-                            print(f"[BOT] Trashed {holding_type}")
-                        else:
-                            next_move = bfs_to_adjacent(controller, (bx, by), trash_loc)
-                            if next_move:
-                                controller.move(bot_id, next_move[0], next_move[1])
+                        if self.act_at(controller, bot_id, (bx, by), trash_loc, controller.trash):
+                            log.debug("[BOT] Trashed %s", holding_type)
                 return
 
-            orders = controller.get_orders(controller.get_team())
-            current_turn = controller.get_turn()
+            orders = controller.get_orders(team)
 
             # Collect all valid orders with their metrics
             candidate_orders = []
+            earliest_expiry = float('inf')
 
             for order in orders:
-                if order["is_active"] and order["order_id"] not in self.processed_orders:
+                if order["is_active"] and not self.is_processed(order["order_id"]):
                     # Calculate remaining time for this order
                     expires_turn = order.get("expires_turn", float('inf'))
-                    remaining_turns = expires_turn - current_turn
+                    remaining_turns = expires_turn - turn
+
+                    # An order's ingredients never change, so its sizing is worked out once
+                    meta = self.order_meta.get(order["order_id"])
+                    if meta is None:
+                        # Check if order has cooking ingredients
+                        _, cooking_foods, _ = RecipePlanner.classify(order["required"])
+                        has_cooking = bool(cooking_foods)
 
-                    # Check if order has cooking ingredients
-                    has_cooking = any(
-                        RecipePlanner.needs_cooking(FoodType[food_name])
-                        for food_name in order["required"]
-                        if food_name in [ft.name for ft in FoodType]
-                    )
+                        # Complexity check: estimate turns needed based on ingredient count
+                        num_ingredients = len(order["required"])
+                        cooking_count = len(cooking_foods)
+
+                        # Empirical formula: ~35 turns per ingredient + 30 per cooking ingredient
+                        estimated_turns = num_ingredients * 35 + cooking_count * 30
+
+                        meta = (has_cooking, num_ingredients, cooking_count, estimated_turns)
+                        self.order_meta[order["order_id"]] = meta
+                    has_cooking, num_ingredients, cooking_count, estimated_turns = meta
 
                     # Skip orders without enough time
                     min_turns_needed = 50 if has_cooking else 10
                     if remaining_turns < min_turns_needed:
-                        print(f"[BOT] Skipping order {order['order_id']} - only {remaining_turns} turns remaining (need {min_turns_needed})")
-                        self.processed_orders.add(order["order_id"])  # Mark as processed so we don't try again
+                        log.debug("[BOT] Skipping order %s - only %s turns remaining (need %d)",
+                                  order['order_id'], remaining_turns, min_turns_needed)
+                        self.mark_processed(order["order_id"])  # Mark as processed so we don't try again
                         continue
 
-                    # Complexity check: estimate turns needed based on ingredient count
-                    num_ingredients = len(order["required"])
-                    cooking_count = sum(1 for food_name in order["required"]
-                                       if food_name in [ft.name for ft in FoodType]
-                                       and RecipePlanner.needs_cooking(FoodType[food_name]))
-
-                    # Empirical formula: ~35 turns per ingredient + 30 per cooking ingredient
-                    estimated_turns = num_ingredients * 35 + cooking_count * 30
-
                     # Skip orders where we likely don't have enough time (need 1.2x safety margin)
                     if remaining_turns < estimated_turns * 1.2:
-                        print(f"[BOT] Skipping order {order['order_id']} - too complex ({num_ingredients} ingredients, {cooking_count} cooking) "
-                              f"for {remaining_turns} turns (need ~{int(estimated_turns * 1.2)})")
-                        self.processed_orders.add(order["order_id"])
+                        log.debug("[BOT] Skipping order %s - too complex (%d ingredients, %d cooking) "
+                                  "for %s turns (need ~%d)", order['order_id'], num_ingredients, cooking_count,
+                                  remaining_turns, int(estimated_turns * 1.2))
+                        self.mark_processed(order["order_id"])
                         continue
 
                     # Calculate value (reward + penalty)
@@ -1322,44 +1766,43 @@ class BotPlayer:
                         'reward': reward,
                         'penalty': penalty
                     })
+                    if expires_turn < earliest_expiry:
+                        earliest_expiry = expires_turn
 
             if not candidate_orders:
                 return
 
             # Strategy: Find the earliest expiring order, then consider all orders
             # that expire within 50 turns of it, and pick the highest value one
-            earliest_expiry = min(c['expires_turn'] for c in candidate_orders)
+            # (the first one seen wins ties)
             deadline_window = earliest_expiry + 50
-
-            # Filter to orders within the deadline window
-            orders_in_window = [c for c in candidate_orders if c['expires_turn'] <= deadline_window]
-
-            # Pick the highest value order in the window
-            best = max(orders_in_window, key=lambda c: c['total_value'])
+            best = None
+            for c in candidate_orders:
+                if c['expires_turn'] <= deadline_window and (best is None or c['total_value'] > best['total_value']):
+                    best = c
 
             order = best['order']
-            print(f"[BOT] Turn {current_turn}: Processing order {order['order_id']}: {order['required']} "
-                  f"({best['remaining_turns']} turns remaining, expires at turn {best['expires_turn']}, "
-                  f"value=${best['total_value']})")
+            log.debug("[BOT] Turn %d: Processing order %s: %s (%s turns remaining, expires at turn %s, value=$%s)",
+                      turn, order['order_id'], order['required'], best['remaining_turns'],
+                      best['expires_turn'], best['total_value'])
 
-            self.processed_orders.add(order["order_id"])
+            self.mark_processed(order["order_id"])
             self.current_order_id = order["order_id"]
 
             # Build command queue (pass controller to detect tile availability)
             self.command_queue = RecipePlanner.build_commands_for_order(order, controller)
             self.current_command_index = 0
 
-            print(f"[BOT] Generated {len(self.command_queue)} commands")
-            for i, cmd in enumerate(self.command_queue):
-                print(f"  {i}: {cmd}")
-
-            if not self.command_queue:
-                return
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[BOT] Generated %d commands", len(self.command_queue))
+                for i, cmd in enumerate(self.command_queue):
+                    log.debug("  %d: %s", i, cmd)
+            self.command_queue.append(END_OF_QUEUE)
 
         # Execute current command
         current_cmd = self.get_current_command()
-        if current_cmd is None:
-            print("[BOT] All commands complete!")
+        if current_cmd is END_OF_QUEUE:
+            log.debug("[BOT] All commands complete!")
             self.current_order_id = None  # Clear current order when all commands done
             return
 
@@ -1368,10 +1811,10 @@ class BotPlayer:
 
         # Check completion
         if current_cmd.is_complete(controller, bot_id):
-            print(f"[BOT] Command complete: {current_cmd}")
+            log.debug("[BOT] Command complete: %s", current_cmd)
             current_cmd.on_complete(controller, bot_id)
             self.advance_command()
 
             # If we just finished the last command, clear current order
-            if self.current_command_index >= len(self.command_queue):
+            if self.command_queue[self.current_command_index] is END_OF_QUEUE:
                 self.current_order_id = None
@@ -6,20 +6,36 @@ This bot uses a command queue system where each command represents an atomic act
 that the bot executes sequentially.
 """
 
-from collections import deque
+from array import array
 from typing import Tuple, Optional, List, Dict
 from abc import ABC, abstractmethod
 
 from robot_controller import RobotController
 from game_constants import FoodType, ShopCosts
+from item import Food, Plate, Pan
 
 
 # ============================================================================
 # PATHFINDING UTILITIES
 # ============================================================================
 
+# The 8 king moves (Chebyshev neighbours), in the order bfs_to_adjacent() expands them
+_DIRS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Scratch for bfs_to_adjacent(), indexed by flat tile id (maps are far below 65536 tiles)
+_bfs_queue = array('H', [0]) * 65536
+_bfs_first_step = bytearray(65536)  # Index into _DIRS8 of the first move toward each tile
+_bfs_seen = bytearray(65536)
+
+
 def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-    """BFS pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable."""
+    """
+    BFS pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable.
+
+    Tiles are flat ids x * height + y. The queue, the first move each tile was
+    reached by and the visited flags live in preallocated module buffers; the
+    queue doubles as the list of visited tiles to clear before returning.
+    """
     gx, gy = goal
     sx, sy = start
 
@@ -27,115 +43,135 @@ def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: T
     if max(abs(sx - gx), abs(sy - gy)) <= 1:
         return None
 
-    queue = deque([(start, [])])
-    visited = {start}
     m = controller.get_map(controller.get_team())
+    w, h = m.width, m.height
+    tiles = m.tiles
 
     # Mark occupied tiles (other bots)
     occupied = set()
     for bid in controller.get_team_bot_ids(controller.get_team()):
         st = controller.get_bot_state(bid)
         if st:
-            occupied.add((st['x'], st['y']))
+            occupied.add(st['x'] * h + st['y'])
+
+    queue, first_step, seen = _bfs_queue, _bfs_first_step, _bfs_seen
+    start_id = sx * h + sy
+    queue[0] = start_id
+    seen[start_id] = 1
+    head, tail = 0, 1
+    result = None
 
-    while queue:
-        (x, y), path = queue.popleft()
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        x, y = divmod(cell, h)
 
         # Check if we're adjacent to goal
-        if max(abs(x - gx), abs(y - gy)) <= 1:
-            return path[0] if path else None
+        if -1 <= x - gx <= 1 and -1 <= y - gy <= 1:
+            result = _DIRS8[first_step[cell]]
+            break
+
+        # Explore 8 directions (Chebyshev); each tile inherits the first move
+        # of the tile it was reached from
+        for d, (dx, dy) in enumerate(_DIRS8):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < w and 0 <= ny < h):
+                continue
+            n = nx * h + ny
+            if seen[n] or n in occupied:
+                continue
+            if not tiles[nx][ny].is_walkable:
+                continue
 
-        # Explore 8 directions (Chebyshev)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
+            seen[n] = 1
+            first_step[n] = d if cell == start_id else first_step[cell]
+            queue[tail] = n
+            tail += 1
 
-                if (nx, ny) in visited:
-                    continue
-                if not (0 <= nx < m.width and 0 <= ny < m.height):
-                    continue
-                if (nx, ny) in occupied and (nx, ny) != start:
-                    continue
-                if not m.tiles[nx][ny].is_walkable:
-                    continue
+    for i in range(tail):
+        seen[queue[i]] = 0
+    return result  # None if unreachable
 
-                visited.add((nx, ny))
-                queue.append(((nx, ny), path + [(dx, dy)]))
 
-    return None  # Unreachable
+# team -> {tile_name: [(x, y), ...]} for get_tile_index()
+_tile_index: Dict = {}
+
+
+def get_tile_index(controller: RobotController) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Positions of every tile on our map, grouped by tile name.
+
+    Tile types never change during a game, so the index is built from a single
+    map copy on first use. Positions are in column-major scan order, so the
+    "first tile" the finders below return keeps its meaning.
+    """
+    team = controller.get_team()
+    index = _tile_index.get(team)
+    if index is None:
+        index = {}
+        m = controller.get_map(controller.get_team())
+        for x in range(m.width):
+            for y in range(m.height):
+                index.setdefault(m.tiles[x][y].tile_name, []).append((x, y))
+        _tile_index[team] = index
+    return index
 
 
 def find_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first tile of given type."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            if m.tiles[x][y].tile_name == tile_name:
-                return (x, y)
-    return None
+    positions = get_tile_index(controller).get(tile_name)
+    return positions[0] if positions else None
 
 
 def find_empty_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first empty tile of given type (no item on it)."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name and getattr(tile, "item", None) is None:
-                return (x, y)
+    tiles = controller.get_map(controller.get_team()).tiles
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        if getattr(tiles[x][y], "item", None) is None:
+            return (x, y)
     return None
 
 
 def find_item_on_tile(controller: RobotController, tile_name: str, item_check) -> Optional[Tuple[int, int]]:
     """Find tile with specific item. item_check is a lambda that takes item and returns bool."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name:
-                item = getattr(tile, "item", None)
-                if item and item_check(item):
-                    return (x, y)
+    tiles = controller.get_map(controller.get_team()).tiles
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        item = getattr(tiles[x][y], "item", None)
+        if item and item_check(item):
+            return (x, y)
     return None
 
 
 def find_closest_tile(controller: RobotController, tile_name: str, from_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
     """Find closest tile of given type to a position."""
-    m = controller.get_map(controller.get_team())
     closest_tile = None
     min_dist = float('inf')
 
     fx, fy = from_pos
-    for x in range(m.width):
-        for y in range(m.height):
-            if m.tiles[x][y].tile_name == tile_name:
-                # Use Chebyshev distance (max of abs differences)
-                dist = max(abs(x - fx), abs(y - fy))
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_tile = (x, y)
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        # Use Chebyshev distance (max of abs differences)
+        dist = max(abs(x - fx), abs(y - fy))
+        if dist < min_dist:
+            min_dist = dist
+            closest_tile = (x, y)
 
     return closest_tile
 
 
 def find_closest_empty_tile(controller: RobotController, tile_name: str, from_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
     """Find closest empty tile of given type to a position."""
-    m = controller.get_map(controller.get_team())
+    tiles = controller.get_map(controller.get_team()).tiles
     closest_tile = None
     min_dist = float('inf')
 
     fx, fy = from_pos
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name and getattr(tile, "item", None) is None:
-                # Use Chebyshev distance (max of abs differences)
-                dist = max(abs(x - fx), abs(y - fy))
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_tile = (x, y)
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        if getattr(tiles[x][y], "item", None) is None:
+            # Use Chebyshev distance (max of abs differences)
+            dist = max(abs(x - fx), abs(y - fy))
+            if dist < min_dist:
+                min_dist = dist
+                closest_tile = (x, y)
 
     return closest_tile
 
@@ -435,7 +471,7 @@ class ChopIngredientCommand(Command):
                 # Verify item is on counter before chopping
                 tile = controller.get_map(controller.get_team()).tiles[cx][cy]
                 item = getattr(tile, "item", None)
-                if item and item.__class__.__name__ == "Food":
+                if type(item) is Food:
                     # Check if already chopped
                     if getattr(item, "chopped", False):
                         print(f"[INFO] ChopIngredient: Food already chopped, skipping to pickup")
@@ -456,7 +492,7 @@ class ChopIngredientCommand(Command):
             # Verify chopped food is still on counter
             tile = controller.get_map(controller.get_team()).tiles[cx][cy]
             item = getattr(tile, "item", None)
-            if item and item.__class__.__name__ == "Food" and getattr(item, "chopped", False):
+            if type(item) is Food and getattr(item, "chopped", False):
                 controller.pickup(bot_id, cx, cy)
                 # VERIFY: Check that we're now holding the item
                 new_bot_state = controller.get_bot_state(bot_id)
@@ -533,7 +569,7 @@ class CookIngredientCommand(Command):
                     # Verify food is now in pan on cooker
                     tile = controller.get_map(controller.get_team()).tiles[cx][cy]
                     item = getattr(tile, "item", None)
-                    if item and item.__class__.__name__ == "Pan":
+                    if type(item) is Pan:
                         self.state = "cooking"
                     else:
                         print(f"[WARN] CookIngredient: Place succeeded but no pan found, retrying")
@@ -550,7 +586,7 @@ class CookIngredientCommand(Command):
             item = getattr(tile, "item", None)
 
             # Check if there's a pan with food cooking
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 if food and hasattr(food, "cooked_stage"):
                     if food.cooked_stage == 1:
@@ -568,7 +604,7 @@ class CookIngredientCommand(Command):
             # Verify food is still cooked and ready
             tile = controller.get_map(controller.get_team()).tiles[cx][cy]
             item = getattr(tile, "item", None)
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 if food and hasattr(food, "cooked_stage") and food.cooked_stage == 1:
                     controller.take_from_pan(bot_id, cx, cy)
@@ -643,7 +679,7 @@ class StartCookingCommand(Command):
                     # Verify food is now in pan on cooker
                     tile = controller.get_map(controller.get_team()).tiles[cx][cy]
                     item = getattr(tile, "item", None)
-                    if item and item.__class__.__name__ == "Pan":
+                    if type(item) is Pan:
                         self.state = "done"
                     else:
                         print(f"[WARN] StartCooking: Place succeeded but no pan found")
@@ -691,7 +727,7 @@ class FinishCookingCommand(Command):
             tile = controller.get_map(controller.get_team()).tiles[cx][cy]
             item = getattr(tile, "item", None)
 
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 # Only pick up when cooked_stage == 1 (perfectly cooked)
                 # If >= 2, the food burned while we were doing other tasks
@@ -722,7 +758,7 @@ class FinishCookingCommand(Command):
             # Verify food is still cooked and ready
             tile = controller.get_map(controller.get_team()).tiles[cx][cy]
             item = getattr(tile, "item", None)
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 if food and hasattr(food, "cooked_stage") and food.cooked_stage == 1:
                     controller.take_from_pan(bot_id, cx, cy)
@@ -768,7 +804,7 @@ class FinishCookingCommand(Command):
                 tile = m.tiles[x][y]
                 if tile.tile_name == "COOKER":
                     item = getattr(tile, "item", None)
-                    if item and item.__class__.__name__ == "Pan":
+                    if type(item) is Pan:
                         food = getattr(item, "food", None)
                         if food and hasattr(food, 'food_name') and food.food_name == self.food_type.name:
                             return (x, y)
@@ -1008,7 +1044,7 @@ class PickupPlateFromCounterCommand(Command):
                     tile = m.tiles[x][y]
                     if tile.tile_name == "COUNTER":
                         item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
+                        if type(item) is Plate:
                             dist = max(abs(x - bx), abs(y - by))
                             if dist < min_dist:
                                 min_dist = dist
@@ -1027,7 +1063,7 @@ class PickupPlateFromCounterCommand(Command):
             # Verify plate is still there
             tile = controller.get_map(controller.get_team()).tiles[px][py]
             item = getattr(tile, "item", None)
-            if item and item.__class__.__name__ == "Plate":
+            if type(item) is Plate:
                 controller.pickup(bot_id, px, py)
             else:
                 # Plate disappeared, find another
@@ -1173,7 +1209,7 @@ class PickupPlateFromBoxCommand(Command):
                     tile = m.tiles[x][y]
                     if tile.tile_name == "BOX":
                         item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
+                        if type(item) is Plate:
                             self.box_loc = (x, y)
                             break
                 if self.box_loc:
@@ -1739,7 +1775,7 @@ class BotPlayer:
                     tile = m.tiles[x][y]
                     if tile.tile_name in ["COUNTER", "BOX"]:
                         item = getattr(tile, "item", None)
-                        if item is not None and item.__class__.__name__ == "Food":
+                        if type(item) is Food:
                             cleanup_target = (x, y)
                             break
                 if cleanup_target:
@@ -1752,7 +1788,7 @@ class BotPlayer:
                         tile = m.tiles[x][y]
                         if tile.tile_name in ["COUNTER", "BOX"]:
                             item = getattr(tile, "item", None)
-                            if item is not None and item.__class__.__name__ == "Plate":
+                            if type(item) is Plate:
                                 cleanup_target = (x, y)
                                 break
                     if cleanup_target:
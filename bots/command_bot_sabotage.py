@@ -6,20 +6,108 @@ This bot uses a command queue system where each command represents an atomic act
 that the bot executes sequentially.
 """
 
-from collections import deque
+import logging
+from array import array
 from typing import Tuple, Optional, List, Dict
 from abc import ABC, abstractmethod
 
 from robot_controller import RobotController
 from game_constants import FoodType, ShopCosts
+from item import Plate, Pan
+
+# Progress messages and diagnostics go through this logger; enable with
+# logging.getLogger("command_bot_sabotage").setLevel(logging.DEBUG).
+# Messages use %-style arguments so nothing is formatted while DEBUG is off.
+log = logging.getLogger("command_bot_sabotage")
+
+# Small integer codes for the tile and item kinds the sabotage/cleanup scans look at (0 = other)
+TILE_CODES = {"COOKER": 1, "COUNTER": 2, "BOX": 3, "SUBMIT": 4}
+TILE_COOKER, TILE_COUNTER, TILE_BOX, TILE_SUBMIT = 1, 2, 3, 4
+ITEM_CODES = {"Pan": 1, "Food": 2, "Plate": 3}
+ITEM_PAN, ITEM_FOOD, ITEM_PLATE = 1, 2, 3
+
+# Surfaces swept for stray plates after an expired order / sabotage, by priority (lower first)
+CLEANUP_SURFACES = {TILE_SUBMIT: 0, TILE_COUNTER: 1, TILE_BOX: 2}
+
+# Surfaces a held item can be dumped on when there is no trash
+DUMP_SURFACES = frozenset({"COUNTER", "BOX"})
+
+# Re-scan the enemy kitchen for sabotage targets at most this often (turns)
+SABOTAGE_RESCAN_TURNS = 3
+
+# When idle with no viable orders, re-evaluate the order list at most this often (turns)
+ORDER_RESCAN_TURNS = 4
 
 
 # ============================================================================
 # PATHFINDING UTILITIES
 # ============================================================================
 
+# team -> (turn, map snapshot) for get_turn_map()
+_turn_maps: Dict = {}
+
+# team -> (turn, item records) for get_turn_items()
+_turn_items: Dict = {}
+
+
+def get_turn_map(controller: RobotController):
+    """
+    Get our map for the current turn.
+
+    controller.get_map() deep-copies the whole map on every call, so a single
+    snapshot is fetched per turn and shared by every lookup made during it.
+    """
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_maps.get(team)
+    if cached is None or cached[0] != turn:
+        cached = (turn, controller.get_map(team))
+        _turn_maps[team] = cached
+    return cached[1]
+
+
+def materialize_items(m) -> List[Tuple[int, int, int, int, object]]:
+    """Flatten a map into (x, y, tile_code, item_code, tile) records, one per tile holding an item."""
+    records = []
+    add = records.append
+    tile_codes = TILE_CODES
+    item_codes = ITEM_CODES
+    for x, column in enumerate(m.tiles):
+        for y, tile in enumerate(column):
+            item = getattr(tile, "item", None)
+            if item is not None:
+                add((x, y, tile_codes.get(tile.tile_name, 0), item_codes.get(type(item).__name__, 0), tile))
+    return records
+
+
+def get_turn_items(controller: RobotController) -> List[Tuple[int, int, int, int, object]]:
+    """Item records (see materialize_items) for this turn's map snapshot."""
+    team = controller.get_team()
+    turn = controller.get_turn()
+    cached = _turn_items.get(team)
+    if cached is None or cached[0] != turn:
+        cached = (turn, materialize_items(get_turn_map(controller)))
+        _turn_items[team] = cached
+    return cached[1]
+
+
+# The 8 king moves (Chebyshev neighbours), in the order bfs_to_adjacent() expands them
+_DIRS8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Scratch for bfs_to_adjacent(), indexed by flat tile id (maps are far below 65536 tiles)
+_bfs_queue = array('H', [0]) * 65536
+_bfs_first_step = bytearray(65536)  # Index into _DIRS8 of the first move toward each tile
+_bfs_seen = bytearray(65536)
+
+
 def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-    """BFS pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable."""
+    """
+    BFS pathfinding: returns next move (dx, dy) toward goal. Returns None if adjacent or unreachable.
+
+    Tiles are flat ids x * height + y. The queue, the first move each tile was
+    reached by and the visited flags live in preallocated module buffers; the
+    queue doubles as the list of visited tiles to clear before returning.
+    """
     gx, gy = goal
     sx, sy = start
 
@@ -27,9 +115,9 @@ def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: T
     if max(abs(sx - gx), abs(sy - gy)) <= 1:
         return None
 
-    queue = deque([(start, [])])
-    visited = {start}
-    m = controller.get_map(controller.get_team())
+    m = get_turn_map(controller)
+    w, h = m.width, m.height
+    tiles = m.tiles
 
     # Mark occupied tiles (only our own team bots to avoid collisions)
     # DON'T mark enemy bots as occupied - they might move!
@@ -37,68 +125,100 @@ def bfs_to_adjacent(controller: RobotController, start: Tuple[int, int], goal: T
     for bid in controller.get_team_bot_ids(controller.get_team()):
         st = controller.get_bot_state(bid)
         if st and (st['x'], st['y']) != start:  # Don't mark our own position as occupied
-            occupied.add((st['x'], st['y']))
+            occupied.add(st['x'] * h + st['y'])
 
-    while queue:
-        (x, y), path = queue.popleft()
+    queue, first_step, seen = _bfs_queue, _bfs_first_step, _bfs_seen
+    start_id = sx * h + sy
+    queue[0] = start_id
+    seen[start_id] = 1
+    head, tail = 0, 1
+    result = None
+
+    while head < tail:
+        cell = queue[head]
+        head += 1
+        x, y = divmod(cell, h)
 
         # Check if we're adjacent to goal
-        if max(abs(x - gx), abs(y - gy)) <= 1:
-            return path[0] if path else None
+        if -1 <= x - gx <= 1 and -1 <= y - gy <= 1:
+            result = _DIRS8[first_step[cell]]
+            break
+
+        # Explore 8 directions (Chebyshev); each tile inherits the first move
+        # of the tile it was reached from
+        for d, (dx, dy) in enumerate(_DIRS8):
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < w and 0 <= ny < h):
+                continue
+            n = nx * h + ny
+            if seen[n] or n in occupied:
+                continue
+            if not tiles[nx][ny].is_walkable:
+                continue
 
-        # Explore 8 directions (Chebyshev)
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
+            seen[n] = 1
+            first_step[n] = d if cell == start_id else first_step[cell]
+            queue[tail] = n
+            tail += 1
+
+    for i in range(tail):
+        seen[queue[i]] = 0
+    return result  # None if unreachable
+
+
+def holding_type_of(holding) -> Optional[str]:
+    """Type name of a held item ('Food', 'Plate', 'Pan'), or None if hands are empty."""
+    if holding is None:
+        return None
+    return holding.get('type') if isinstance(holding, dict) else 'unknown'
 
-                if (nx, ny) in visited:
-                    continue
-                if not (0 <= nx < m.width and 0 <= ny < m.height):
-                    continue
-                if (nx, ny) in occupied and (nx, ny) != start:
-                    continue
-                if not m.tiles[nx][ny].is_walkable:
-                    continue
 
-                visited.add((nx, ny))
-                queue.append(((nx, ny), path + [(dx, dy)]))
+# team -> {tile_name: [(x, y), ...]} for get_tile_index()
+_tile_index: Dict = {}
 
-    return None  # Unreachable
+
+def get_tile_index(controller: RobotController) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Positions of every tile on our map, grouped by tile name.
+
+    Tile types never change during a game, so the index is built from a single
+    map copy on first use. Positions are in column-major scan order, so the
+    "first tile" the finders below return keeps its meaning.
+    """
+    team = controller.get_team()
+    index = _tile_index.get(team)
+    if index is None:
+        index = {}
+        m = get_turn_map(controller)
+        for x in range(m.width):
+            for y in range(m.height):
+                index.setdefault(m.tiles[x][y].tile_name, []).append((x, y))
+        _tile_index[team] = index
+    return index
 
 
 def find_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first tile of given type."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            if m.tiles[x][y].tile_name == tile_name:
-                return (x, y)
-    return None
+    positions = get_tile_index(controller).get(tile_name)
+    return positions[0] if positions else None
 
 
 def find_empty_tile(controller: RobotController, tile_name: str) -> Optional[Tuple[int, int]]:
     """Find first empty tile of given type (no item on it)."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name and getattr(tile, "item", None) is None:
-                return (x, y)
+    tiles = get_turn_map(controller).tiles
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        if getattr(tiles[x][y], "item", None) is None:
+            return (x, y)
     return None
 
 
 def find_item_on_tile(controller: RobotController, tile_name: str, item_check) -> Optional[Tuple[int, int]]:
     """Find tile with specific item. item_check is a lambda that takes item and returns bool."""
-    m = controller.get_map(controller.get_team())
-    for x in range(m.width):
-        for y in range(m.height):
-            tile = m.tiles[x][y]
-            if tile.tile_name == tile_name:
-                item = getattr(tile, "item", None)
-                if item and item_check(item):
-                    return (x, y)
+    tiles = get_turn_map(controller).tiles
+    for x, y in get_tile_index(controller).get(tile_name, ()):
+        item = getattr(tiles[x][y], "item", None)
+        if item and item_check(item):
+            return (x, y)
     return None
 
 
@@ -106,6 +226,11 @@ def find_item_on_tile(controller: RobotController, tile_name: str, item_check) -
 # COMMAND FRAMEWORK
 # ============================================================================
 
+# Command.step() status codes
+CONTINUE = 0
+COMPLETE = 1
+
+
 class Command(ABC):
     """
     Base class for all bot commands.
@@ -114,6 +239,8 @@ class Command(ABC):
     Commands execute over multiple turns until completion.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self, controller: RobotController, bot_id: int) -> None:
         """Execute one step of this command (called each turn)."""
@@ -132,6 +259,14 @@ class Command(ABC):
         """Called when command completes (optional hook)."""
         pass
 
+    def step(self, controller: RobotController, bot_id: int) -> int:
+        """Run one turn: execute, then check completion. Returns CONTINUE or COMPLETE."""
+        self.execute(controller, bot_id)
+        if not self.is_complete(controller, bot_id):
+            return CONTINUE
+        self.on_complete(controller, bot_id)
+        return COMPLETE
+
     @abstractmethod
     def __str__(self) -> str:
         """Human-readable command description for debugging."""
@@ -145,6 +280,8 @@ class Command(ABC):
 class BuyIngredientCommand(Command):
     """Command: Buy a specific ingredient from shop."""
 
+    __slots__ = ('food_type', 'shop_loc')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
         self.shop_loc = None
@@ -191,6 +328,8 @@ class BuyIngredientCommand(Command):
 class BuyPlateCommand(Command):
     """Command: Buy a plate from shop."""
 
+    __slots__ = ('shop_loc',)
+
     def __init__(self):
         self.shop_loc = None
 
@@ -231,6 +370,8 @@ class BuyPlateCommand(Command):
 class ChopIngredientCommand(Command):
     """Command: Chop held ingredient on counter."""
 
+    __slots__ = ('counter_loc', 'state')
+
     def __init__(self):
         self.counter_loc = None
         self.state = "navigating"  # navigating → placing → chopping → picking_up → done
@@ -293,6 +434,8 @@ class ChopIngredientCommand(Command):
 class CookIngredientCommand(Command):
     """Command: Cook held ingredient on cooker (place in pan, wait for cook, pickup)."""
 
+    __slots__ = ('cooker_loc', 'state')
+
     def __init__(self):
         self.cooker_loc = None
         self.state = "navigating"  # navigating → placing → cooking → picking_up → done
@@ -329,11 +472,11 @@ class CookIngredientCommand(Command):
             # Wait for cooking to complete (cooked_stage == 1, perfectly cooked)
             # Food is placed in a Pan on the cooker, so we need to check the Pan's food
             cx, cy = self.cooker_loc
-            tile = controller.get_map(controller.get_team()).tiles[cx][cy]
+            tile = get_turn_map(controller).tiles[cx][cy]
             item = getattr(tile, "item", None)
 
             # Check if there's a pan with food cooking
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 if food and hasattr(food, "cooked_stage") and food.cooked_stage == 1:
                     self.state = "picking_up"
@@ -362,6 +505,8 @@ class CookIngredientCommand(Command):
 class StartCookingCommand(Command):
     """Command: Start cooking held ingredient (navigate to cooker and place in pan)."""
 
+    __slots__ = ('cooker_loc', 'state')
+
     def __init__(self):
         self.cooker_loc = None
         self.state = "navigating"  # navigating → placing → done
@@ -405,6 +550,8 @@ class StartCookingCommand(Command):
 class FinishCookingCommand(Command):
     """Command: Pick up cooked food from cooker when ready."""
 
+    __slots__ = ('food_type', 'cooker_loc', 'state')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
         self.cooker_loc = None
@@ -426,10 +573,10 @@ class FinishCookingCommand(Command):
 
             # Check if food is cooked (stage == 1: perfectly cooked, not burnt)
             cx, cy = self.cooker_loc
-            tile = controller.get_map(controller.get_team()).tiles[cx][cy]
+            tile = get_turn_map(controller).tiles[cx][cy]
             item = getattr(tile, "item", None)
 
-            if item and item.__class__.__name__ == "Pan":
+            if type(item) is Pan:
                 food = getattr(item, "food", None)
                 # Only pick up when cooked_stage == 1 (perfectly cooked)
                 # If >= 2, the food burned while we were doing other tasks
@@ -464,13 +611,13 @@ class FinishCookingCommand(Command):
 
     def _find_cooker_with_food(self, controller: RobotController) -> Optional[Tuple[int, int]]:
         """Find cooker with our food type cooking."""
-        m = controller.get_map(controller.get_team())
+        m = get_turn_map(controller)
         for x in range(m.width):
             for y in range(m.height):
                 tile = m.tiles[x][y]
                 if tile.tile_name == "COOKER":
                     item = getattr(tile, "item", None)
-                    if item and item.__class__.__name__ == "Pan":
+                    if type(item) is Pan:
                         food = getattr(item, "food", None)
                         if food and hasattr(food, 'food_name') and food.food_name == self.food_type.name:
                             return (x, y)
@@ -488,6 +635,8 @@ class StoreInBoxCommand(Command):
     This command tries to find an appropriate box (empty or matching item type).
     """
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -506,7 +655,7 @@ class StoreInBoxCommand(Command):
             # Find a suitable box: either empty or containing the same food type
             holding_food_name = holding.get('food_name') if holding and holding.get('type') == 'Food' else None
 
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             for x in range(m.width):
                 for y in range(m.height):
                     tile = m.tiles[x][y]
@@ -549,6 +698,8 @@ class StoreInBoxCommand(Command):
 class PlaceOnCounterCommand(Command):
     """Command: Place held item on counter."""
 
+    __slots__ = ('counter_loc',)
+
     def __init__(self):
         self.counter_loc = None
 
@@ -591,6 +742,8 @@ class PlaceOnCounterCommand(Command):
 class PickupFromBoxCommand(Command):
     """Command: Pick up specific food type from box."""
 
+    __slots__ = ('food_type', 'box_loc')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
         self.box_loc = None
@@ -640,6 +793,8 @@ class PickupFromBoxCommand(Command):
 class PickupPlateFromCounterCommand(Command):
     """Command: Pick up plate from counter."""
 
+    __slots__ = ('plate_loc',)
+
     def __init__(self):
         self.plate_loc = None
 
@@ -656,13 +811,13 @@ class PickupPlateFromCounterCommand(Command):
 
         if self.plate_loc is None:
             # Find plate on counter (item is actual object, not dict)
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             for x in range(m.width):
                 for y in range(m.height):
                     tile = m.tiles[x][y]
                     if tile.tile_name == "COUNTER":
                         item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
+                        if type(item) is Plate:
                             self.plate_loc = (x, y)
                             break
                 if self.plate_loc:
@@ -695,6 +850,8 @@ class PickupPlateFromCounterCommand(Command):
 class PlaceInBoxCommand(Command):
     """Command: Place held item (plate or food) in a box."""
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -713,7 +870,7 @@ class PlaceInBoxCommand(Command):
             # Find a suitable box: either empty or containing the same item type
             holding_type = holding.get('type') if isinstance(holding, dict) else holding.__class__.__name__
 
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             for x in range(m.width):
                 for y in range(m.height):
                     tile = m.tiles[x][y]
@@ -757,6 +914,8 @@ class PlaceInBoxCommand(Command):
 class PickupPlateFromBoxCommand(Command):
     """Command: Pick up plate from box."""
 
+    __slots__ = ('box_loc',)
+
     def __init__(self):
         self.box_loc = None
 
@@ -773,13 +932,13 @@ class PickupPlateFromBoxCommand(Command):
 
         if self.box_loc is None:
             # Find box with plate
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             for x in range(m.width):
                 for y in range(m.height):
                     tile = m.tiles[x][y]
                     if tile.tile_name == "BOX":
                         item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
+                        if type(item) is Plate:
                             self.box_loc = (x, y)
                             break
                 if self.box_loc:
@@ -812,6 +971,8 @@ class PickupPlateFromBoxCommand(Command):
 class AddFoodToPlateCommand(Command):
     """Command: Add food from counter to held plate."""
 
+    __slots__ = ('food_type', 'food_loc', 'state')
+
     def __init__(self, food_type: FoodType):
         self.food_type = food_type
         self.food_loc = None
@@ -863,6 +1024,8 @@ class AddFoodToPlateCommand(Command):
 class SubmitOrderCommand(Command):
     """Command: Submit completed plate at submit station."""
 
+    __slots__ = ('order_id', 'submit_loc', 'failed_attempts', 'dropping_failed_plate')
+
     def __init__(self, order_id: int = None):
         self.order_id = order_id  # Keep for reference, but not used in submit()
         self.submit_loc = None
@@ -890,7 +1053,8 @@ class SubmitOrderCommand(Command):
                 # Check if we've been stuck trying to submit for too long
                 if self.failed_attempts >= 3:
                     self.dropping_failed_plate = True
-                    print(f"[SUBMIT ERROR] Failed to submit {self.failed_attempts} times - plate doesn't match any order!")
+                    log.warning("[SUBMIT ERROR] Failed to submit %s times - plate doesn't match any order!",
+                                self.failed_attempts)
                     # Drop the failed plate in a box so we can continue
                     box_loc = find_empty_tile(controller, "BOX")
                     if not box_loc:
@@ -899,7 +1063,7 @@ class SubmitOrderCommand(Command):
                         bx_loc, by_loc = box_loc
                         if max(abs(bx - bx_loc), abs(by - by_loc)) <= 1:
                             controller.place(bot_id, bx_loc, by_loc)
-                            print(f"[SUBMIT ERROR] Dropped failed plate in box at ({bx_loc},{by_loc})")
+                            log.warning("[SUBMIT ERROR] Dropped failed plate in box at (%s,%s)", bx_loc, by_loc)
                         else:
                             # Navigate to box
                             next_move = bfs_to_adjacent(controller, (bx, by), box_loc)
@@ -911,7 +1075,7 @@ class SubmitOrderCommand(Command):
                 success = controller.submit(bot_id, sx, sy)
                 if not success:
                     self.failed_attempts += 1
-                    print(f"[SUBMIT] Submit failed (attempt {self.failed_attempts}/3)")
+                    log.debug("[SUBMIT] Submit failed (attempt %s/3)", self.failed_attempts)
             return
 
         next_move = bfs_to_adjacent(controller, (bx, by), self.submit_loc)
@@ -927,7 +1091,7 @@ class SubmitOrderCommand(Command):
         if self.dropping_failed_plate:
             hands_empty = bot_state.get('holding') is None
             if hands_empty:
-                print(f"[SUBMIT] Successfully dropped failed plate, hands now empty")
+                log.debug("[SUBMIT] Successfully dropped failed plate, hands now empty")
             return hands_empty
 
         # Normal submission complete when we're no longer holding the plate
@@ -965,7 +1129,7 @@ class RecipePlanner:
     @staticmethod
     def count_tiles(controller: RobotController, tile_name: str) -> int:
         """Count number of tiles of a given type on the map."""
-        m = controller.get_map(controller.get_team())
+        m = get_turn_map(controller)
         count = 0
         for x in range(m.width):
             for y in range(m.height):
@@ -1003,7 +1167,7 @@ class RecipePlanner:
             try:
                 required_foods.append(FoodType[food_name])
             except KeyError:
-                print(f"[WARN] Unknown food type: {food_name}")
+                log.warning("[WARN] Unknown food type: %s", food_name)
                 continue
 
         # Separate into cooking and non-cooking ingredients
@@ -1019,16 +1183,16 @@ class RecipePlanner:
             # If only 1 counter and at least 1 box, use box for plate storage
             if counter_count == 1 and box_count >= 1:
                 use_box_for_plate = True
-                print(f"[BOT] Detected 1 counter + {box_count} box(es) - using box for plate storage")
+                log.debug("[BOT] Detected 1 counter + %s box(es) - using box for plate storage", box_count)
 
             # Check if a clean, empty plate already exists on counter or in box
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             for x in range(m.width):
                 for y in range(m.height):
                     tile = m.tiles[x][y]
                     if tile.tile_name in ["COUNTER", "BOX"]:
                         item = getattr(tile, "item", None)
-                        if item and item.__class__.__name__ == "Plate":
+                        if type(item) is Plate:
                             # Check if plate is clean and empty
                             is_dirty = getattr(item, "dirty", False)
                             food_on_plate = getattr(item, "food", [])
@@ -1037,7 +1201,8 @@ class RecipePlanner:
                                 # Determine where the plate is stored
                                 if tile.tile_name == "BOX":
                                     use_box_for_plate = True
-                                print(f"[BOT] Found existing clean empty plate on {tile.tile_name} at ({x},{y}) - skipping plate purchase")
+                                log.debug("[BOT] Found existing clean empty plate on %s at (%s,%s) - skipping plate purchase",
+                                          tile.tile_name, x, y)
                                 break
                 if plate_already_exists:
                     break
@@ -1169,7 +1334,9 @@ class BotPlayer:
         self.plates_placed = 0  # Track how many plates we've placed for sabotage
         self.sabotage_stuck_counter = 0  # Track how many turns we've been stuck
         self.sabotage_skip_targets = set()  # Set of targets to skip if we're stuck on them
-        self.sabotage_last_target = None  # Last target we tried to reach
+        self.sabotage_last_target = None  # Last target we tried to reach: (x, y, description)
+        self.sabotage_scan_turn = -1  # Turn we last scanned the enemy kitchen for targets
+        self.order_scan_turn = None  # Turn of the last order scan that found nothing to do
         self.sabotage_recursion_depth = 0  # Track recursion depth to prevent infinite loops
 
     def get_current_command(self) -> Optional[Command]:
@@ -1190,16 +1357,15 @@ class BotPlayer:
 
         bx, by = bot_state['x'], bot_state['y']
         holding = bot_state.get('holding')
+        holding_type = holding_type_of(holding)
         current_turn = controller.get_turn()
 
         # Debug: log position and holding status every 10 turns
         if current_turn % 10 == 0:
-            holding_str = holding.get('type') if holding else "nothing"
-            print(f"[SABOTAGE DEBUG] Turn {current_turn}: Bot at ({bx},{by}), holding {holding_str}")
+            log.debug("[SABOTAGE DEBUG] Turn %d: Bot at (%d,%d), holding %s", current_turn, bx, by, holding_type or "nothing")
 
         # If holding something, try to put pans in enemy boxes, otherwise trash
         if holding is not None:
-            holding_type = holding.get('type') if isinstance(holding, dict) else 'unknown'
 
             # Special handling for Pans - try to hide them in enemy's box first
             if holding_type == 'Pan':
@@ -1212,7 +1378,7 @@ class BotPlayer:
                     if max(abs(bx - bx_loc), abs(by - by_loc)) <= 1:
                         success = controller.place(bot_id, bx_loc, by_loc)
                         if success:
-                            print(f"[SABOTAGE] Hid Pan in enemy's box at ({bx_loc},{by_loc})!")
+                            log.debug("[SABOTAGE] Hid Pan in enemy's box at (%s,%s)!", bx_loc, by_loc)
                         return
                     else:
                         # Navigate to box
@@ -1221,13 +1387,13 @@ class BotPlayer:
                             controller.move(bot_id, next_move[0], next_move[1])
                         return
                 # If no box available, we'll take it back with us (fall through to end of sabotage)
-                print(f"[SABOTAGE] No enemy box available for Pan, will take it back")
+                log.debug("[SABOTAGE] No enemy box available for Pan, will take it back")
                 return
 
             # For non-Pan items, trash them
             trash_loc = find_tile(controller, "TRASH")
             if not trash_loc:
-                print(f"[SABOTAGE] ERROR: No trash found in enemy map!")
+                log.warning("[SABOTAGE] ERROR: No trash found in enemy map!")
                 return
 
             tx, ty = trash_loc
@@ -1235,8 +1401,7 @@ class BotPlayer:
                 # Adjacent to trash, throw away item
                 success = controller.trash(bot_id, tx, ty)
                 if success:
-                    holding_type = holding.get('type') if isinstance(holding, dict) else holding.__class__.__name__
-                    print(f"[SABOTAGE] Trashed enemy's {holding_type}!")
+                    log.debug("[SABOTAGE] Trashed enemy's %s!", holding_type)
                 return
             else:
                 # Navigate to trash
@@ -1247,123 +1412,145 @@ class BotPlayer:
 
         # Not holding anything - find something to steal
         # Priority: 1. Pans with food (cooking in progress), 2. Food/plates on counters
-        m = controller.get_map(controller.get_team())
+        m = get_turn_map(controller)
+
+        # Keep heading for the last target between scans, as long as it's still there
+        target = self.sabotage_last_target
+        if target is not None and current_turn - self.sabotage_scan_turn < SABOTAGE_RESCAN_TURNS:
+            tx, ty, description = target
+            if getattr(m.tiles[tx][ty], "item", None) is not None:
+                if self._approach_sabotage_target(controller, bot_id, bx, by, tx, ty, description):
+                    return
+        self.sabotage_last_target = None
+        self.sabotage_scan_turn = current_turn
 
         # Search for items to steal
         targets = []  # List of (priority, distance, x, y, description)
+        add_target = targets.append
 
-        for x in range(m.width):
-            for y in range(m.height):
-                tile = m.tiles[x][y]
-                item = getattr(tile, "item", None)
-
-                if item is None:
-                    continue
-
-                item_class = item.__class__.__name__
-                distance = max(abs(bx - x), abs(by - y))
+        for x, y, tile_code, item_code, tile in get_turn_items(controller):
+            item = tile.item
+            distance = max(abs(bx - x), abs(by - y))
 
-                # Priority 1: Pans (with or without food) on COOKER
-                if tile.tile_name == "COOKER" and item_class == "Pan":
-                    food = getattr(item, "food", None)
-                    if food:
-                        targets.append((10, -distance, x, y, f"Pan with {food.food_name} on COOKER"))
-                    else:
-                        targets.append((8, -distance, x, y, "Empty Pan on COOKER"))
-
-                # Priority 2: Food on COUNTER (prepared ingredients)
-                elif tile.tile_name == "COUNTER" and item_class == "Food":
-                    food_name = getattr(item, "food_name", "Unknown")
-                    targets.append((7, -distance, x, y, f"{food_name} on COUNTER"))
-
-                # Priority 3: Plates with food on COUNTER
-                elif tile.tile_name == "COUNTER" and item_class == "Plate":
-                    foods = getattr(item, "food", [])
-                    if foods:
-                        targets.append((6, -distance, x, y, f"Plate with {len(foods)} items on COUNTER"))
-                    else:
-                        targets.append((5, -distance, x, y, "Empty plate on COUNTER"))
+            # Priority 1: Pans (with or without food) on COOKER
+            if tile_code == TILE_COOKER and item_code == ITEM_PAN:
+                food = getattr(item, "food", None)
+                if food:
+                    add_target((10, -distance, x, y, f"Pan with {food.food_name} on COOKER"))
+                else:
+                    add_target((8, -distance, x, y, "Empty Pan on COOKER"))
+
+            # Priority 2: Food on COUNTER (prepared ingredients)
+            elif tile_code == TILE_COUNTER and item_code == ITEM_FOOD:
+                food_name = getattr(item, "food_name", "Unknown")
+                add_target((7, -distance, x, y, f"{food_name} on COUNTER"))
+
+            # Priority 3: Plates with food on COUNTER
+            elif tile_code == TILE_COUNTER and item_code == ITEM_PLATE:
+                foods = getattr(item, "food", [])
+                if foods:
+                    add_target((6, -distance, x, y, f"Plate with {len(foods)} items on COUNTER"))
+                else:
+                    add_target((5, -distance, x, y, "Empty plate on COUNTER"))
 
         # Sort by priority (higher first), then distance (closer first)
         targets.sort(reverse=True)
 
         if not targets:
-            print(f"[SABOTAGE] No items found to steal! Enemy kitchen is clean.")
+            log.debug("[SABOTAGE] No items found to steal! Enemy kitchen is clean.")
             return
 
         # Try to steal the highest priority target
         for priority, neg_dist, tx, ty, description in targets:
-            if max(abs(bx - tx), abs(by - ty)) <= 1:
-                # Adjacent - try to pick up
-                success = controller.pickup(bot_id, tx, ty)
-                if success:
-                    print(f"[SABOTAGE] Stole: {description}")
+            if self._approach_sabotage_target(controller, bot_id, bx, by, tx, ty, description):
                 return
-            else:
-                # Navigate toward target
-                next_move = bfs_to_adjacent(controller, (bx, by), (tx, ty))
-                if next_move:
-                    success = controller.move(bot_id, next_move[0], next_move[1])
-                    if success:
-                        print(f"[SABOTAGE] Moving to steal: {description}")
-                    return
 
         # Couldn't reach any targets
-        print(f"[SABOTAGE] Found {len(targets)} items but couldn't reach any")
+        log.debug("[SABOTAGE] Found %s items but couldn't reach any", len(targets))
+
+    def _approach_sabotage_target(self, controller: RobotController, bot_id: int,
+                                  bx: int, by: int, tx: int, ty: int, description: str) -> bool:
+        """Pick up the target if adjacent, otherwise step toward it. Returns False if unreachable."""
+        if max(abs(bx - tx), abs(by - ty)) <= 1:
+            # Adjacent - try to pick up
+            success = controller.pickup(bot_id, tx, ty)
+            if success:
+                log.debug("[SABOTAGE] Stole: %s", description)
+            self.sabotage_last_target = None
+            return True
+
+        # Navigate toward target
+        next_move = bfs_to_adjacent(controller, (bx, by), (tx, ty))
+        if not next_move:
+            return False
+        success = controller.move(bot_id, next_move[0], next_move[1])
+        if success:
+            log.debug("[SABOTAGE] Moving to steal: %s", description)
+        self.sabotage_last_target = (tx, ty, description)
+        return True
 
     def play_turn(self, controller: RobotController):
         """Main bot logic - called each turn."""
-        bots = controller.get_team_bot_ids(controller.get_team())
+        team = controller.get_team()
+        bots = controller.get_team_bot_ids(team)
         if not bots:
             return
 
         current_turn = controller.get_turn()
         switch_info = controller.get_switch_info()
 
+        # Fetch orders once per turn and index them by id for O(1) status checks
+        orders = controller.get_orders(team)
+        orders_by_id = {o["order_id"]: o for o in orders}
+
         bot_id = bots[0]
 
         # SABOTAGE LOGIC: Always use Bot 0 for switching to enemy map
         # Calculate target turn if not set yet (switch with 25 turns left in sabotage window)
         if self.sabotage_target_turn is None and switch_info['window_active']:
             self.sabotage_target_turn = switch_info['window_end_turn'] - 25
-            print(f"[SABOTAGE] Planning to switch at turn {self.sabotage_target_turn} (25 turns before window ends)")
+            log.debug("[SABOTAGE] Planning to switch at turn %s (25 turns before window ends)",
+                      self.sabotage_target_turn)
 
         # IMPORTANT: Only switch when bot 0 isn't holding anything
         bot0_state = controller.get_bot_state(bots[0])
         bot0_holding = bot0_state.get('holding') if bot0_state else None
+        bot0_holding_type = holding_type_of(bot0_holding)
 
         if not self.has_switched and self.sabotage_target_turn is not None and current_turn >= self.sabotage_target_turn and controller.can_switch_maps():
             # Only switch if Bot 0's hands are empty
             if bot0_holding is None:
-                print(f"[SABOTAGE] Turn {current_turn}: Bot 0 switching to enemy map for sabotage!")
+                log.debug("[SABOTAGE] Turn %s: Bot 0 switching to enemy map for sabotage!", current_turn)
                 if controller.switch_maps():
                     self.has_switched = True
                     self.sabotage_mode = True
                     # DON'T clear command queue - we'll resume it when we return
                     # Just note that we're in sabotage mode now
-                    print(f"[SABOTAGE] Successfully switched! Will sabotage until turn {switch_info['window_end_turn']}")
-                    print(f"[SABOTAGE] Saved command queue state: {len(self.command_queue)} commands, index {self.current_command_index}, order {self.current_order_id}")
+                    log.debug("[SABOTAGE] Successfully switched! Will sabotage until turn %s",
+                              switch_info['window_end_turn'])
+                    log.debug("[SABOTAGE] Saved command queue state: %s commands, index %s, order %s",
+                              len(self.command_queue), self.current_command_index, self.current_order_id)
                 else:
-                    print(f"[SABOTAGE] Failed to switch maps!")
+                    log.debug("[SABOTAGE] Failed to switch maps!")
             else:
                 if current_turn % 10 == 0:  # Log every 10 turns to avoid spam
-                    print(f"[SABOTAGE] Turn {current_turn}: Waiting to switch - Bot 0 is holding {bot0_holding.get('type')}")
+                    log.debug("[SABOTAGE] Turn %s: Waiting to switch - Bot 0 is holding %s",
+                              current_turn, bot0_holding_type)
 
         # Check if we just returned from sabotage
         if self.sabotage_mode and not switch_info['window_active']:
-            print(f"[SABOTAGE] Turn {current_turn}: Returned to our kitchen")
+            log.debug("[SABOTAGE] Turn %s: Returned to our kitchen", current_turn)
             self.sabotage_mode = False
             self.returned_from_sabotage = True
 
             # If Bot 0 is holding anything (stolen from enemy), handle it
             bot0_state = controller.get_bot_state(bots[0])
             if bot0_state and bot0_state.get('holding'):
-                holding = bot0_state.get('holding')
-                holding_type = holding.get('type') if isinstance(holding, dict) else 'unknown'
+                holding_type = holding_type_of(bot0_state.get('holding'))
 
                 # If holding a Pan, we can't trash it - place it in an empty box instead
                 if holding_type == 'Pan':
-                    print(f"[SABOTAGE] Returned with Pan - placing in box")
+                    log.debug("[SABOTAGE] Returned with Pan - placing in box")
                     box_loc = find_empty_tile(controller, "BOX")
                     if not box_loc:
                         # No empty box, try any box
@@ -1373,11 +1560,11 @@ class BotPlayer:
                         bx_loc, by_loc = box_loc
                         if max(abs(bx - bx_loc), abs(by - by_loc)) <= 1:
                             controller.place(bots[0], bx_loc, by_loc)
-                            print(f"[SABOTAGE] Placed Pan in box at ({bx_loc},{by_loc})")
+                            log.debug("[SABOTAGE] Placed Pan in box at (%s,%s)", bx_loc, by_loc)
                             # Successfully placed pan, clear the flag and fall through to normal operation
                         else:
                             # Navigate to box
-                            print(f"[SABOTAGE] Navigating to box to place Pan")
+                            log.debug("[SABOTAGE] Navigating to box to place Pan")
                             next_move = bfs_to_adjacent(controller, (bx, by), box_loc)
                             if next_move:
                                 controller.move(bots[0], next_move[0], next_move[1])
@@ -1390,11 +1577,11 @@ class BotPlayer:
                         tx, ty = trash_loc
                         if max(abs(bx - tx), abs(by - ty)) <= 1:
                             controller.trash(bots[0], tx, ty)
-                            print(f"[SABOTAGE] Trashed held {holding_type} on return")
+                            log.debug("[SABOTAGE] Trashed held %s on return", holding_type)
                             # Successfully trashed item, clear the flag and fall through to normal operation
                         else:
                             # Not adjacent to trash, navigate there
-                            print(f"[SABOTAGE] Navigating to trash {holding_type}")
+                            log.debug("[SABOTAGE] Navigating to trash %s", holding_type)
                             next_move = bfs_to_adjacent(controller, (bx, by), trash_loc)
                             if next_move:
                                 controller.move(bots[0], next_move[0], next_move[1])
@@ -1402,11 +1589,11 @@ class BotPlayer:
 
             # Check if the order we were working on expired during sabotage
             if self.current_order_id is not None:
-                orders = controller.get_orders(controller.get_team())
-                order_still_active = any(o["order_id"] == self.current_order_id and o["is_active"] for o in orders)
+                order_obj = orders_by_id.get(self.current_order_id)
+                order_still_active = order_obj is not None and order_obj["is_active"]
 
                 if not order_still_active:
-                    print(f"[SABOTAGE] Order {self.current_order_id} expired during sabotage - clearing workspace")
+                    log.debug("[SABOTAGE] Order %s expired during sabotage - clearing workspace", self.current_order_id)
                     # Clear the command queue and enter cleanup mode
                     self.command_queue = []
                     self.current_command_index = 0
@@ -1415,17 +1602,17 @@ class BotPlayer:
                     self.returned_from_sabotage = False
                     # Fall through to cleanup logic below
                 else:
-                    print(f"[SABOTAGE] Order {self.current_order_id} still active - but commands have stale state after teleport")
+                    log.debug("[SABOTAGE] Order %s still active - but commands have stale state after teleport",
+                              self.current_order_id)
                     # The command queue has internal state (positions, etc.) that's now invalid after teleporting
                     # We need to regenerate the command queue for the same order
-                    order_obj = next((o for o in orders if o["order_id"] == self.current_order_id), None)
                     if order_obj:
-                        print(f"[SABOTAGE] Regenerating command queue for order {self.current_order_id}")
+                        log.debug("[SABOTAGE] Regenerating command queue for order %s", self.current_order_id)
                         self.command_queue = RecipePlanner.build_commands_for_order(order_obj, controller)
                         self.current_command_index = 0
-                        print(f"[SABOTAGE] Regenerated {len(self.command_queue)} commands")
+                        log.debug("[SABOTAGE] Regenerated %s commands", len(self.command_queue))
                     else:
-                        print(f"[SABOTAGE] ERROR: Could not find order {self.current_order_id}!")
+                        log.warning("[SABOTAGE] ERROR: Could not find order %s!", self.current_order_id)
                         self.command_queue = []
                         self.current_command_index = 0
                         self.current_order_id = None
@@ -1434,7 +1621,7 @@ class BotPlayer:
                 # No order was active, just reset the flag
                 self.returned_from_sabotage = False
 
-            print(f"[SABOTAGE] Bot 0 will resume normal operations")
+            log.debug("[SABOTAGE] Bot 0 will resume normal operations")
             # Don't return - fall through to normal order processing
 
         # If in sabotage mode, execute sabotage strategy with Bot 0
@@ -1445,11 +1632,12 @@ class BotPlayer:
 
         # Check if current order is still active (hasn't expired)
         if self.current_order_id is not None:
-            orders = controller.get_orders(controller.get_team())
-            order_still_active = any(o["order_id"] == self.current_order_id and o["is_active"] for o in orders)
+            order_obj = orders_by_id.get(self.current_order_id)
+            order_still_active = order_obj is not None and order_obj["is_active"]
 
             if not order_still_active:
-                print(f"[BOT] Turn {controller.get_turn()}: Order {self.current_order_id} expired, clearing workspace")
+                log.debug("[BOT] Turn %s: Order %s expired, clearing workspace",
+                          controller.get_turn(), self.current_order_id)
 
                 # Clear command queue and enter cleanup mode
                 self.command_queue = []
@@ -1467,10 +1655,10 @@ class BotPlayer:
 
             bx, by = bot_state['x'], bot_state['y']
             holding = bot_state.get('holding')
+            holding_type = holding_type_of(holding)
 
             # If holding something, get rid of it first
             if holding is not None:
-                holding_type = holding.get('type') if isinstance(holding, dict) else 'unknown'
 
                 # Trash everything we're holding during cleanup
                 trash_loc = find_tile(controller, "TRASH")
@@ -1478,7 +1666,7 @@ class BotPlayer:
                     tx, ty = trash_loc
                     if max(abs(bx - tx), abs(by - ty)) <= 1:
                         controller.trash(bot_id, tx, ty)
-                        print(f"[CLEANUP] Trashed {holding_type}")
+                        log.debug("[CLEANUP] Trashed %s", holding_type)
                         return
                     else:
                         next_move = bfs_to_adjacent(controller, (bx, by), trash_loc)
@@ -1487,50 +1675,62 @@ class BotPlayer:
                         return
                 else:
                     # No trash tile! Fallback: place on any empty counter/box
-                    print(f"[CLEANUP] WARNING: No trash found, placing {holding_type} on counter/box")
-                    m = controller.get_map(controller.get_team())
-                    for tile_name in ["COUNTER", "BOX"]:
-                        for x in range(m.width):
-                            for y in range(m.height):
-                                tile = m.tiles[x][y]
-                                if tile.tile_name == tile_name and getattr(tile, "item", None) is None:
-                                    if max(abs(bx - x), abs(by - y)) <= 1:
-                                        controller.place(bot_id, x, y)
-                                        print(f"[CLEANUP] Placed {holding_type} on {tile_name}")
-                                        return
-                                    else:
-                                        next_move = bfs_to_adjacent(controller, (bx, by), (x, y))
-                                        if next_move:
-                                            controller.move(bot_id, next_move[0], next_move[1])
-                                        return
+                    log.warning("[CLEANUP] WARNING: No trash found, placing %s on counter/box", holding_type)
+                    m = get_turn_map(controller)
+                    # Single pass: first empty COUNTER wins, otherwise remember the first empty BOX
+                    place_target = None
+                    for x in range(m.width):
+                        for y in range(m.height):
+                            tile = m.tiles[x][y]
+                            if tile.tile_name in DUMP_SURFACES and getattr(tile, "item", None) is None:
+                                if tile.tile_name == "COUNTER":
+                                    place_target = (x, y, tile.tile_name)
+                                    break
+                                if place_target is None:
+                                    place_target = (x, y, tile.tile_name)
+                        if place_target and place_target[2] == "COUNTER":
+                            break
+                    if place_target:
+                        x, y, tile_name = place_target
+                        if max(abs(bx - x), abs(by - y)) <= 1:
+                            controller.place(bot_id, x, y)
+                            log.debug("[CLEANUP] Placed %s on %s", holding_type, tile_name)
+                        else:
+                            next_move = bfs_to_adjacent(controller, (bx, by), (x, y))
+                            if next_move:
+                                controller.move(bot_id, next_move[0], next_move[1])
+                        return
                     # Can't find anywhere to place - just stay holding and try next turn
-                    print(f"[CLEANUP] ERROR: Can't find anywhere to place {holding_type}!")
+                    log.warning("[CLEANUP] ERROR: Can't find anywhere to place %s!", holding_type)
                     return
 
             # Hands are empty, clean up items from critical surfaces
             # Priority: SUBMIT > COUNTER > BOX
             # NOTE: Do NOT clean COOKER (pans supposed to be there), SINK (dirty plates), or SINKTABLE (generates clean plates!)
-            m = controller.get_map(controller.get_team())
+            m = get_turn_map(controller)
             cleanup_target = None
-            cleanup_surfaces = ["SUBMIT", "COUNTER", "BOX"]
-
-            # Count how many plates we need to clean
-            plates_found = []
-            for surface_type in cleanup_surfaces:
-                for x in range(m.width):
-                    for y in range(m.height):
-                        tile = m.tiles[x][y]
-                        if tile.tile_name == surface_type:
-                            item = getattr(tile, "item", None)
-                            # Only pick up Plates (enemy sabotage) - don't pick up food/pans
-                            # CRITICAL: SINKTABLE has infinite clean plates, so checking tile_name is important!
-                            if item is not None and hasattr(item, '__class__') and item.__class__.__name__ == 'Plate':
-                                plates_found.append((x, y, tile.tile_name))
-                                if cleanup_target is None:
-                                    cleanup_target = (x, y)
+            cleanup_rank = len(CLEANUP_SURFACES)
+
+            # Single pass over the tiles holding items, keeping the plate on the highest-priority
+            # surface. A plate on SUBMIT can't be beaten, so stop as soon as we see one
+            # (unless debug logging wants the full list of plates).
+            plates_found = [] if log.isEnabledFor(logging.DEBUG) else None
+            for x, y, tile_code, item_code, tile in get_turn_items(controller):
+                rank = CLEANUP_SURFACES.get(tile_code)
+                # Only pick up Plates (enemy sabotage) - don't pick up food/pans
+                # CRITICAL: SINKTABLE has infinite clean plates, so checking the tile kind is important!
+                if rank is None or item_code != ITEM_PLATE:
+                    continue
+                if plates_found is not None:
+                    plates_found.append((x, y, tile.tile_name))
+                if rank < cleanup_rank:
+                    cleanup_target = (x, y)
+                    cleanup_rank = rank
+                    if cleanup_rank == 0 and plates_found is None:
+                        break
 
             if plates_found:
-                print(f"[CLEANUP DEBUG] Found {len(plates_found)} plates to clean at: {plates_found}")
+                log.debug("[CLEANUP DEBUG] Found %d plates to clean at: %s", len(plates_found), plates_found)
 
             if cleanup_target:
                 cx, cy = cleanup_target
@@ -1539,12 +1739,13 @@ class BotPlayer:
                     if holding is None:
                         tile_name_before = m.tiles[cx][cy].tile_name
                         item_before = m.tiles[cx][cy].item
-                        item_type_before = item_before.__class__.__name__ if item_before else "Unknown"
+                        item_type_before = type(item_before).__name__ if item_before else "Unknown"
                         pickup_success = controller.pickup(bot_id, cx, cy)
-                        print(f"[CLEANUP] Picked up {item_type_before} from {tile_name_before} at ({cx},{cy}), success={pickup_success}")
+                        log.debug("[CLEANUP] Picked up %s from %s at (%s,%s), success=%s",
+                                  item_type_before, tile_name_before, cx, cy, pickup_success)
                     else:
                         # Already holding something - this shouldn't happen, but handle it
-                        print(f"[CLEANUP] ERROR: Tried to pickup but already holding {holding.get('type')}!")
+                        log.warning("[CLEANUP] ERROR: Tried to pickup but already holding %s!", holding_type)
                     return
                 else:
                     next_move = bfs_to_adjacent(controller, (bx, by), cleanup_target)
@@ -1553,7 +1754,7 @@ class BotPlayer:
                     return
 
             # All critical surfaces are clean
-            print(f"[CLEANUP] All critical surfaces cleared, ready for new orders")
+            log.debug("[CLEANUP] All critical surfaces cleared, ready for new orders")
             self.cleaning_workspace = False
             self.returned_from_sabotage = False  # Reset flag
             # DON'T return - fall through to order processing below!
@@ -1563,15 +1764,14 @@ class BotPlayer:
         if not self.command_queue or self.current_command_index >= len(self.command_queue):
             bot_state = controller.get_bot_state(bot_id)
             holding_check = bot_state.get('holding') if bot_state else None
-            print(f"[BOT DEBUG] Command queue empty check: holding={holding_check}")
-            if bot_state and bot_state.get('holding') is not None:
+            log.debug("[BOT DEBUG] Command queue empty check: holding=%s", holding_check)
+            if holding_check is not None:
                 # Still holding something from a previous order, need to get rid of it
-                holding = bot_state.get('holding')
-                holding_type = holding.get('type') if isinstance(holding, dict) else 'unknown'
+                holding_type = holding_type_of(holding_check)
 
                 # If holding a Plate or Pan, try to place it somewhere (can't trash these)
                 if holding_type == 'Plate' or holding_type == 'Pan':
-                    print(f"[BOT] Holding {holding_type}, will place in box to clear hands")
+                    log.debug("[BOT] Holding %s, will place in box to clear hands", holding_type)
                     # Find an empty box to dump the item
                     target_loc = find_empty_tile(controller, "BOX")
                     if not target_loc:
@@ -1587,7 +1787,7 @@ class BotPlayer:
 
                         if max(abs(bx - cx), abs(by - cy)) <= 1:
                             controller.place(bot_id, cx, cy)
-                            print(f"[BOT] Placed {holding_type}, hands now free")
+                            log.debug("[BOT] Placed %s, hands now free", holding_type)
                             return  # Return immediately after placing to avoid starting new order in same turn
                         else:
                             next_move = bfs_to_adjacent(controller, (bx, by), target_loc)
@@ -1596,7 +1796,7 @@ class BotPlayer:
                         return  # Always return when handling plate/pan
                 else:
                     # For other items (Food), trash them
-                    print(f"[BOT] Holding {holding_type}, navigating to trash")
+                    log.debug("[BOT] Holding %s, navigating to trash", holding_type)
                     trash_loc = find_tile(controller, "TRASH")
                     if trash_loc:
                         tx, ty = trash_loc
@@ -1604,22 +1804,27 @@ class BotPlayer:
 
                         if max(abs(bx - tx), abs(by - ty)) <= 1:
                             trash_result = controller.trash(bot_id, tx, ty)
-                            print(f"[BOT] Trashed {holding_type}, result={trash_result}")
+                            log.debug("[BOT] Trashed %s, result=%s", holding_type, trash_result)
                             # Verify hands are now empty
-                            bot_state_after = controller.get_bot_state(bot_id)
-                            holding_after = bot_state_after.get('holding') if bot_state_after else None
-                            print(f"[BOT DEBUG] After trash: holding={holding_after}")
+                            if log.isEnabledFor(logging.DEBUG):
+                                bot_state_after = controller.get_bot_state(bot_id)
+                                holding_after = bot_state_after.get('holding') if bot_state_after else None
+                                log.debug("[BOT DEBUG] After trash: holding=%s", holding_after)
                         else:
                             next_move = bfs_to_adjacent(controller, (bx, by), trash_loc)
                             if next_move:
                                 controller.move(bot_id, next_move[0], next_move[1])
                 return
 
-            orders = controller.get_orders(controller.get_team())
             current_turn = controller.get_turn()
 
+            # Nothing was worth taking last time - only look again every few turns
+            if self.order_scan_turn is not None and current_turn - self.order_scan_turn < ORDER_RESCAN_TURNS:
+                return
+
             # Collect all valid orders with their metrics
             candidate_orders = []
+            food_members = FoodType.__members__
 
             for order in orders:
                 if order["is_active"] and order["order_id"] not in self.processed_orders:
@@ -1627,33 +1832,33 @@ class BotPlayer:
                     expires_turn = order.get("expires_turn", float('inf'))
                     remaining_turns = expires_turn - current_turn
 
-                    # Check if order has cooking ingredients
-                    has_cooking = any(
-                        RecipePlanner.needs_cooking(FoodType[food_name])
-                        for food_name in order["required"]
-                        if food_name in [ft.name for ft in FoodType]
-                    )
+                    # Count cooking ingredients in one pass (FoodType.__members__ is a name -> member dict)
+                    cooking_count = 0
+                    for food_name in order["required"]:
+                        ft = food_members.get(food_name)
+                        if ft is not None and RecipePlanner.needs_cooking(ft):
+                            cooking_count += 1
+                    has_cooking = cooking_count > 0
 
                     # Skip orders without enough time
                     min_turns_needed = 50 if has_cooking else 10
                     if remaining_turns < min_turns_needed:
-                        print(f"[BOT] Skipping order {order['order_id']} - only {remaining_turns} turns remaining (need {min_turns_needed})")
+                        log.debug("[BOT] Skipping order %s - only %s turns remaining (need %s)",
+                                  order['order_id'], remaining_turns, min_turns_needed)
                         self.processed_orders.add(order["order_id"])  # Mark as processed so we don't try again
                         continue
 
                     # Complexity check: estimate turns needed based on ingredient count
                     num_ingredients = len(order["required"])
-                    cooking_count = sum(1 for food_name in order["required"]
-                                       if food_name in [ft.name for ft in FoodType]
-                                       and RecipePlanner.needs_cooking(FoodType[food_name]))
 
                     # Empirical formula: ~35 turns per ingredient + 30 per cooking ingredient
                     estimated_turns = num_ingredients * 35 + cooking_count * 30
 
                     # Skip orders where we likely don't have enough time (need 1.2x safety margin)
                     if remaining_turns < estimated_turns * 1.2:
-                        print(f"[BOT] Skipping order {order['order_id']} - too complex ({num_ingredients} ingredients, {cooking_count} cooking) "
-                              f"for {remaining_turns} turns (need ~{int(estimated_turns * 1.2)})")
+                        log.debug("[BOT] Skipping order %s - too complex (%s ingredients, %s cooking) for %s turns (need ~%s)",
+                                  order['order_id'], num_ingredients, cooking_count, remaining_turns,
+                                  int(estimated_turns * 1.2))
                         self.processed_orders.add(order["order_id"])
                         continue
 
@@ -1672,7 +1877,9 @@ class BotPlayer:
                     })
 
             if not candidate_orders:
+                self.order_scan_turn = current_turn
                 return
+            self.order_scan_turn = None
 
             # Strategy: Find the earliest expiring order, then consider all orders
             # that expire within 50 turns of it, and pick the highest value one
@@ -1686,9 +1893,9 @@ class BotPlayer:
             best = max(orders_in_window, key=lambda c: c['total_value'])
 
             order = best['order']
-            print(f"[BOT] Turn {current_turn}: Processing order {order['order_id']}: {order['required']} "
-                  f"({best['remaining_turns']} turns remaining, expires at turn {best['expires_turn']}, "
-                  f"value=${best['total_value']})")
+            log.debug("[BOT] Turn %s: Processing order %s: %s (%s turns remaining, expires at turn %s, value=$%s)",
+                      current_turn, order['order_id'], order['required'], best['remaining_turns'],
+                      best['expires_turn'], best['total_value'])
 
             self.processed_orders.add(order["order_id"])
             self.current_order_id = order["order_id"]
@@ -1697,9 +1904,10 @@ class BotPlayer:
             self.command_queue = RecipePlanner.build_commands_for_order(order, controller)
             self.current_command_index = 0
 
-            print(f"[BOT] Generated {len(self.command_queue)} commands")
-            for i, cmd in enumerate(self.command_queue):
-                print(f"  {i}: {cmd}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[BOT] Generated %s commands", len(self.command_queue))
+                for i, cmd in enumerate(self.command_queue):
+                    log.debug("  %s: %s", i, cmd)
 
             if not self.command_queue:
                 return
@@ -1707,17 +1915,13 @@ class BotPlayer:
         # Execute current command
         current_cmd = self.get_current_command()
         if current_cmd is None:
-            print("[BOT] All commands complete!")
+            log.debug("[BOT] All commands complete!")
             self.current_order_id = None  # Clear current order when all commands done
             return
 
-        # Execute
-        current_cmd.execute(controller, bot_id)
-
-        # Check completion
-        if current_cmd.is_complete(controller, bot_id):
-            print(f"[BOT] Command complete: {current_cmd}")
-            current_cmd.on_complete(controller, bot_id)
+        # Execute one step and check completion
+        if current_cmd.step(controller, bot_id) == COMPLETE:
+            log.debug("[BOT] Command complete: %s", current_cmd)
             self.advance_command()
 
             # If we just finished the last command, clear current order
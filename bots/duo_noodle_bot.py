@@ -1,242 +1,321 @@
+import heapq
 import random
-from collections import deque
+import sys
 from typing import Tuple, Optional, List
 
 from game_constants import Team, TileType, FoodType, ShopCosts
 from robot_controller import RobotController
 from item import Pan, Plate, Food
 
+#8 king moves, in the order the path search has always expanded them
+_DIRS = ((0, -1), (0, 1), (-1, 0), (-1, -1), (-1, 1), (1, 0), (1, -1), (1, 1))
+
+#idle bots jitter diagonally
+_IDLE_DIRS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+#states with no work of their own, mapped straight to the state they hand off to
+#state 7: start the cook, but place() already started cooking so we just go to 8
+_PASSTHROUGH_STATES = {7: 8}
+
+#interned tile names: index keys and lookups share one object, so dict hits compare by identity
+_TILE_COUNTER = sys.intern("COUNTER")
+_TILE_COOKER = sys.intern("COOKER")
+_TILE_SHOP = sys.intern("SHOP")
+_TILE_TRASH = sys.intern("TRASH")
+_TILE_SUBMIT = sys.intern("SUBMIT")
+
+#enum properties are fixed for the game, resolve them once instead of every turn
+_PAN_COST = ShopCosts.PAN.buy_cost
+_PLATE_COST = ShopCosts.PLATE.buy_cost
+_MEAT_COST = FoodType.MEAT.buy_cost
+_NOODLES_COST = FoodType.NOODLES.buy_cost
+
+def astar_first_step(walk, w, h, sx, sy, tx, ty):
+    #shortest path over the walk bitmap to a cell within 1 of (tx, ty); returns the first move, (0, 0) if already there, or None
+    #a* ordered by chebyshev distance to the goal ring, exact for unit-cost king moves, so open maps expand ~one lane of cells
+    start = sx * h + sy
+    best = [w * h] * (w * h)
+    best[start] = 0
+    closed = bytearray(w * h)
+    heap = [(max(abs(sx - tx), abs(sy - ty), 1) - 1, 0, start, None)]
+    pop, push = heapq.heappop, heapq.heappush
+    while heap:
+        _, g, cell, first = pop(heap)
+        if closed[cell]: continue
+        closed[cell] = 1
+        cx, cy = divmod(cell, h)
+        if max(abs(cx - tx), abs(cy - ty)) <= 1:
+            return first if first is not None else (0, 0)
+        g += 1
+        for dx, dy in _DIRS:
+            nx, ny = cx + dx, cy + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                n = nx * h + ny
+                if walk[n] and not closed[n] and g < best[n]:
+                    best[n] = g
+                    push(heap, (g + max(abs(nx - tx), abs(ny - ty), 1) - 1, g, n, first if first is not None else (dx, dy)))
+    return None
+
 class BotPlayer:
     def __init__(self, map_copy):
         self.map = map_copy
         self.assembly_counter = None 
         self.cooker_loc = None
         self.my_bot_id = None
+        self._initialized_tiles = False
+        self._static_tiles = {} # tile_name -> [(x, y), ...]; tile types never move
+        self._path_cache = {} # (start, target) -> a* first step; walkability is static so entries never go stale
+
+        #one sweep of the initial map: flat walkability bitmap (indexed x * height + y) and tile index
+        w, h = map_copy.width, map_copy.height
+        self._walk = bytearray(w * h)
+        for x in range(w):
+            for y in range(h):
+                tile = map_copy.tiles[x][y]
+                if tile.is_walkable:
+                    self._walk[x * h + y] = 1
+                self._static_tiles.setdefault(sys.intern(tile.tile_name), []).append((x, y))
         
+        self._team = None # set at the top of every play_turn
+        #nearest shop/trash/submit, picked once per cycle and cleared on restart
+        self._preferred_shop = None
+        self._preferred_trash = None
+        self._preferred_submit = None
         self.state = 0
+        self._state_table = {n: getattr(self, "_state_%d" % n) for n in range(17) if n not in _PASSTHROUGH_STATES}
 
-    def get_bfs_path(self, controller: RobotController, start: Tuple[int, int], target_predicate) -> Optional[Tuple[int, int]]:
-        queue = deque([(start, [])]) 
-        visited = set([start])
-        w, h = self.map.width, self.map.height
-
-        while queue:
-            (curr_x, curr_y), path = queue.popleft()
-            tile = controller.get_tile(controller.get_team(), curr_x, curr_y)
-            if target_predicate(curr_x, curr_y, tile):
-                if not path: return (0, 0) 
-                return path[0] 
-
-            for dx in [0, -1, 1]:
-                for dy in [0, -1, 1]:
-                    if dx == 0 and dy == 0: continue
-                    nx, ny = curr_x + dx, curr_y + dy
-                    if 0 <= nx < w and 0 <= ny < h and (nx, ny) not in visited:
-                        if controller.get_map(controller.get_team()).is_tile_walkable(nx, ny):
-                            visited.add((nx, ny))
-                            queue.append(((nx, ny), path + [(dx, dy)]))
-        return None
+    def _astar_first_step_to_adjacent(self, start: Tuple[int, int], tx: int, ty: int) -> Optional[Tuple[int, int]]:
+        #adjacency is a fixed test on coordinates, so no tiles are read and the answer is memoized
+        cache_key = (start, (tx, ty))
+        if cache_key in self._path_cache:
+            return self._path_cache[cache_key]
+        step = astar_first_step(self._walk, self.map.width, self.map.height, start[0], start[1], tx, ty)
+        self._path_cache[cache_key] = step
+        return step
 
     def move_towards(self, controller: RobotController, bot_id: int, target_x: int, target_y: int) -> bool:
         bot_state = controller.get_bot_state(bot_id)
         bx, by = bot_state['x'], bot_state['y']
-        def is_adjacent_to_target(x, y, tile):
-            return max(abs(x - target_x), abs(y - target_y)) <= 1
-        if is_adjacent_to_target(bx, by, None): return True
-        step = self.get_bfs_path(controller, (bx, by), is_adjacent_to_target)
+        if max(abs(bx - target_x), abs(by - target_y)) <= 1: return True
+        #one step away: take the direct king move if it lands next to the target
+        sdx = (target_x > bx) - (target_x < bx)
+        sdy = (target_y > by) - (target_y < by)
+        nx, ny = bx + sdx, by + sdy
+        if max(abs(nx - target_x), abs(ny - target_y)) <= 1 and 0 <= nx < self.map.width and 0 <= ny < self.map.height \
+                and self._walk[nx * self.map.height + ny]:
+            controller.move(bot_id, sdx, sdy)
+            return False
+        step = self._astar_first_step_to_adjacent((bx, by), target_x, target_y)
         if step and (step[0] != 0 or step[1] != 0):
             controller.move(bot_id, step[0], step[1])
             return False 
         return False 
 
     def find_nearest_tile(self, controller: RobotController, bot_x: int, bot_y: int, tile_name: str) -> Optional[Tuple[int, int]]:
-        best_dist = 9999
-        best_pos = None
-        m = controller.get_map(controller.get_team())
-        for x in range(m.width):
-            for y in range(m.height):
-                tile = m.tiles[x][y]
-                if tile.tile_name == tile_name:
-                    dist = max(abs(bot_x - x), abs(bot_y - y))
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_pos = (x, y)
-        return best_pos
-
-    def play_turn(self, controller: RobotController):
-        my_bots = controller.get_team_bot_ids(controller.get_team())
-        if not my_bots: return
-    
-        self.my_bot_id = my_bots[0]
-        bot_id = self.my_bot_id
-        
-        bot_info = controller.get_bot_state(bot_id)
-        bx, by = bot_info['x'], bot_info['y']
+        positions = self._static_tiles.get(tile_name)
+        if not positions: return None
+        return min(positions, key=lambda p: max(abs(bot_x - p[0]), abs(bot_y - p[1])))
 
-        if self.assembly_counter is None:
-            self.assembly_counter = self.find_nearest_tile(controller, bx, by, "COUNTER")
-        if self.cooker_loc is None:
-            self.cooker_loc = self.find_nearest_tile(controller, bx, by, "COOKER")
-
-        if not self.assembly_counter or not self.cooker_loc: return
-
-        cx, cy = self.assembly_counter
-        kx, ky = self.cooker_loc
-
-        if self.state in [2, 8, 10] and bot_info.get('holding'):
-            self.state = 16
+    def _reset_preferred(self):
+        self._preferred_shop = None
+        self._preferred_trash = None
+        self._preferred_submit = None
 
+    def _state_0(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 0: init + checking the pan
-        if self.state == 0:
-            tile = controller.get_tile(controller.get_team(), kx, ky)
-            if tile and isinstance(tile.item, Pan):
-                self.state = 2
-            else:
-                self.state = 1
+        tile = controller.get_tile(self._team, kx, ky)
+        if tile and isinstance(tile.item, Pan):
+            self.state = 2
+        else:
+            self.state = 1
 
+    def _state_1(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 1: buy pan
-        elif self.state == 1:
-            holding = bot_info.get('holding')
-            if holding: # assume it's the pan
-                if self.move_towards(controller, bot_id, kx, ky):
-                    if controller.place(bot_id, kx, ky):
-                        self.state = 2
-            else:
-                shop_pos = self.find_nearest_tile(controller, bx, by, "SHOP")
-                if not shop_pos: return
-                sx, sy = shop_pos
-                if self.move_towards(controller, bot_id, sx, sy):
-                    if controller.get_team_money(controller.get_team()) >= ShopCosts.PAN.buy_cost:
-                        controller.buy(bot_id, ShopCosts.PAN, sx, sy)
-
-        #state 2: buy meat
-        elif self.state == 2:
-            shop_pos = self.find_nearest_tile(controller, bx, by, "SHOP")
+        holding = bot_info.get('holding')
+        if holding: # assume it's the pan
+            if self.move_towards(controller, bot_id, kx, ky):
+                if controller.place(bot_id, kx, ky):
+                    self.state = 2
+        else:
+            if self._preferred_shop is None:
+                self._preferred_shop = self.find_nearest_tile(controller, bx, by, _TILE_SHOP)
+            shop_pos = self._preferred_shop
+            if not shop_pos: return
             sx, sy = shop_pos
             if self.move_towards(controller, bot_id, sx, sy):
-                if controller.get_team_money(controller.get_team()) >= FoodType.MEAT.buy_cost:
-                    if controller.buy(bot_id, FoodType.MEAT, sx, sy):
-                        self.state = 3
+                if controller.get_team_money(self._team) >= _PAN_COST:
+                    controller.buy(bot_id, ShopCosts.PAN, sx, sy)
+
+    def _state_2(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
+        #state 2: buy meat
+        if self._preferred_shop is None:
+            self._preferred_shop = self.find_nearest_tile(controller, bx, by, _TILE_SHOP)
+        shop_pos = self._preferred_shop
+        sx, sy = shop_pos
+        if self.move_towards(controller, bot_id, sx, sy):
+            if controller.get_team_money(self._team) >= _MEAT_COST:
+                if controller.buy(bot_id, FoodType.MEAT, sx, sy):
+                    self.state = 3
 
+    def _state_3(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 3: put meat on counter
-        elif self.state == 3:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.place(bot_id, cx, cy):
-                    self.state = 4
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.place(bot_id, cx, cy):
+                self.state = 4
 
+    def _state_4(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 4: chop meat
-        elif self.state == 4:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.chop(bot_id, cx, cy):
-                    self.state = 5
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.chop(bot_id, cx, cy):
+                self.state = 5
 
+    def _state_5(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 5: pickup meat
-        elif self.state == 5:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.pickup(bot_id, cx, cy):
-                    self.state = 6
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.pickup(bot_id, cx, cy):
+                self.state = 6
 
+    def _state_6(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 6: put meat on counter
-        elif self.state == 6:
-            if self.move_towards(controller, bot_id, kx, ky):
-                # Using the NEW logic where place() starts cooking automatically
-                if controller.place(bot_id, kx, ky):
-                    self.state = 8 # Skip state 7
-
-        #state 7: start the cook, but is cooking so we just go
-        elif self.state == 7:
-            self.state = 8
+        if self.move_towards(controller, bot_id, kx, ky):
+            # Using the NEW logic where place() starts cooking automatically
+            if controller.place(bot_id, kx, ky):
+                self.state = 8 # Skip state 7
 
+    def _state_8(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 8: buy the plate
-        elif self.state == 8:
-            shop_pos = self.find_nearest_tile(controller, bx, by, "SHOP")
-            sx, sy = shop_pos
-            if self.move_towards(controller, bot_id, sx, sy):
-                if controller.get_team_money(controller.get_team()) >= ShopCosts.PLATE.buy_cost:
-                    if controller.buy(bot_id, ShopCosts.PLATE, sx, sy):
-                        self.state = 9
+        if self._preferred_shop is None:
+            self._preferred_shop = self.find_nearest_tile(controller, bx, by, _TILE_SHOP)
+        shop_pos = self._preferred_shop
+        sx, sy = shop_pos
+        if self.move_towards(controller, bot_id, sx, sy):
+            if controller.get_team_money(self._team) >= _PLATE_COST:
+                if controller.buy(bot_id, ShopCosts.PLATE, sx, sy):
+                    self.state = 9
 
+    def _state_9(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 9: put the plate on the counter
-        elif self.state == 9:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.place(bot_id, cx, cy):
-                    self.state = 10
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.place(bot_id, cx, cy):
+                self.state = 10
 
+    def _state_10(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 10: buy noodle
-        elif self.state == 10:
-            shop_pos = self.find_nearest_tile(controller, bx, by, "SHOP")
-            sx, sy = shop_pos
-            if self.move_towards(controller, bot_id, sx, sy):
-                if controller.get_team_money(controller.get_team()) >= FoodType.NOODLES.buy_cost:
-                    if controller.buy(bot_id, FoodType.NOODLES, sx, sy):
-                        self.state = 11
+        if self._preferred_shop is None:
+            self._preferred_shop = self.find_nearest_tile(controller, bx, by, _TILE_SHOP)
+        shop_pos = self._preferred_shop
+        sx, sy = shop_pos
+        if self.move_towards(controller, bot_id, sx, sy):
+            if controller.get_team_money(self._team) >= _NOODLES_COST:
+                if controller.buy(bot_id, FoodType.NOODLES, sx, sy):
+                    self.state = 11
 
+    def _state_11(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 11: add noodles to plate
-        elif self.state == 11:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.add_food_to_plate(bot_id, cx, cy):
-                    self.state = 12
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.add_food_to_plate(bot_id, cx, cy):
+                self.state = 12
 
+    def _state_12(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 12: wait and take meat
-        elif self.state == 12:
-            if self.move_towards(controller, bot_id, kx, ky):
-                tile = controller.get_tile(controller.get_team(), kx, ky)
-                if tile and isinstance(tile.item, Pan) and tile.item.food:
-                    food = tile.item.food
-                    if food.cooked_stage == 1:
-                        if controller.take_from_pan(bot_id, kx, ky):
-                            self.state = 13
-                    elif food.cooked_stage == 2:
-
-                        #trash
-                        if controller.take_from_pan(bot_id, kx, ky):
-                            self.state = 16 
+        if self.move_towards(controller, bot_id, kx, ky):
+            tile = controller.get_tile(self._team, kx, ky)
+            if tile and isinstance(tile.item, Pan) and tile.item.food:
+                food = tile.item.food
+                if food.cooked_stage == 1:
+                    if controller.take_from_pan(bot_id, kx, ky):
+                        self.state = 13
+                elif food.cooked_stage == 2:
+
+                    #trash
+                    if controller.take_from_pan(bot_id, kx, ky):
+                        self.state = 16 
+            else:
+                if bot_info.get('holding'):
+                    #trash
+                    self.state = 16
                 else:
-                    if bot_info.get('holding'):
-                        #trash
-                        self.state = 16
-                    else:
-                        #restart
-                        self.state = 2 
+                    #restart
+                    self.state = 2 
+                    self._reset_preferred()
 
+    def _state_13(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 13: add meat to plate
-        elif self.state == 13:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.add_food_to_plate(bot_id, cx, cy):
-                    self.state = 14
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.add_food_to_plate(bot_id, cx, cy):
+                self.state = 14
 
+    def _state_14(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 14: pick up the plate
-        elif self.state == 14:
-            if self.move_towards(controller, bot_id, cx, cy):
-                if controller.pickup(bot_id, cx, cy):
-                    self.state = 15
+        if self.move_towards(controller, bot_id, cx, cy):
+            if controller.pickup(bot_id, cx, cy):
+                self.state = 15
 
+    def _state_15(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 15: submit
-        elif self.state == 15:
-            submit_pos = self.find_nearest_tile(controller, bx, by, "SUBMIT")
-            ux, uy = submit_pos
-            if self.move_towards(controller, bot_id, ux, uy):
-                if controller.submit(bot_id, ux, uy):
-                    self.state = 0
+        if self._preferred_submit is None:
+            self._preferred_submit = self.find_nearest_tile(controller, bx, by, _TILE_SUBMIT)
+        submit_pos = self._preferred_submit
+        ux, uy = submit_pos
+        if self.move_towards(controller, bot_id, ux, uy):
+            if controller.submit(bot_id, ux, uy):
+                self.state = 0
+                self._reset_preferred()
 
+    def _state_16(self, controller: RobotController, bot_id: int, bot_info, bx: int, by: int, cx: int, cy: int, kx: int, ky: int):
         #state 16: trash
-        elif self.state == 16:
-            trash_pos = self.find_nearest_tile(controller, bx, by, "TRASH")
-            if not trash_pos: return
-            tx, ty = trash_pos
-            if self.move_towards(controller, bot_id, tx, ty):
-                if controller.trash(bot_id, tx, ty):
-                    self.state = 2 #restart
+        if self._preferred_trash is None:
+            self._preferred_trash = self.find_nearest_tile(controller, bx, by, _TILE_TRASH)
+        trash_pos = self._preferred_trash
+        if not trash_pos: return
+        tx, ty = trash_pos
+        if self.move_towards(controller, bot_id, tx, ty):
+            if controller.trash(bot_id, tx, ty):
+                self.state = 2 #restart
+                self._reset_preferred()
+
+    def play_turn(self, controller: RobotController):
+        if self.state in _PASSTHROUGH_STATES:
+            self.state = _PASSTHROUGH_STATES[self.state]
+        self._team = controller.get_team()
+        my_bots = controller.get_team_bot_ids(self._team)
+        if not my_bots: return
+    
+        self.my_bot_id = my_bots[0]
+        bot_id = self.my_bot_id
+        
+        bot_info = controller.get_bot_state(bot_id)
+        bx, by = bot_info['x'], bot_info['y']
+
+        #counter and cooker are fixed for the game: pick both once, from the first turn's position
+        if not self._initialized_tiles:
+            self.assembly_counter = self.find_nearest_tile(controller, bx, by, _TILE_COUNTER)
+            self.cooker_loc = self.find_nearest_tile(controller, bx, by, _TILE_COOKER)
+            self._initialized_tiles = True
+
+        if not self.assembly_counter or not self.cooker_loc: return
+
+        cx, cy = self.assembly_counter
+        kx, ky = self.cooker_loc
+
+        if self.state in [2, 8, 10] and bot_info.get('holding'):
+            self.state = 16
+
+        #one handler per state, see _state_N above
+        self._state_table[self.state](controller, bot_id, bot_info, bx, by, cx, cy, kx, ky)
+
+        #idle bots only need positions and the static walk bitmap, no map copy
+        walk, w, h = self._walk, self.map.width, self.map.height
+        get_bot_state = controller.get_bot_state
         for i in range(1, len(my_bots)):
             self.my_bot_id = my_bots[i]
             bot_id = self.my_bot_id
             
-            bot_info = controller.get_bot_state(bot_id)
+            bot_info = get_bot_state(bot_id)
             bx, by = bot_info['x'], bot_info['y']
 
-            dx = random.choice([-1, 1])
-            dy = random.choice([-1, 1])
+            dx, dy = _IDLE_DIRS[random.randrange(4)]
             nx,ny = bx + dx, by + dy
-            if controller.get_map(controller.get_team()).is_tile_walkable(nx, ny):
+            if 0 <= nx < w and 0 <= ny < h and walk[nx * h + ny]:
                 controller.move(bot_id, dx, dy)
                 return
\ No newline at end of file
@@ -29,28 +29,9 @@ def _load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def _render_layout(tiles: List[List[dict]]) -> List[List[str]]:
-    if not tiles:
-        raise ValueError("tiles is empty")
-    width = len(tiles[0])
-    if any(len(r) != width for r in tiles):
-        raise ValueError("tiles has inconsistent row widths")
-
-    layout: List[List[str]] = []
-    for row in tiles:
-        out_row: List[str] = []
-        for cell in row:
-            name = cell.get("tile_name")
-            if name not in CHAR_BY_TILE_NAME:
-                raise ValueError(f'Unknown tile_name "{name}"')
-            out_row.append(CHAR_BY_TILE_NAME[name])
-        layout.append(out_row)
-    return layout
-
-
-def _place_bots(layout: List[List[str]], bots: List[dict]) -> None:
-    height = len(layout)
-    width = len(layout[0]) if height else 0
+def _bot_cells(bots: List[dict], width: int, height: int) -> Dict[int, List[int]]:
+    """Validate bot positions and group their columns by file row."""
+    cells: Dict[int, List[int]] = {}
     for bot in bots:
         x = bot.get("x")
         y = bot.get("y")
@@ -59,7 +40,41 @@ def _place_bots(layout: List[List[str]], bots: List[dict]) -> None:
         file_row = height - 1 - y
         if not (0 <= x < width and 0 <= file_row < height):
             raise ValueError(f"Bot out of bounds: {bot}")
-        layout[file_row][x] = "b"
+        cells.setdefault(file_row, []).append(x)
+    return cells
+
+
+def _render_layout(tiles: List[List[dict]], bots: List[dict]) -> List[str]:
+    if not tiles:
+        raise ValueError("tiles is empty")
+    width = len(tiles[0])
+    if any(len(r) != width for r in tiles):
+        raise ValueError("tiles has inconsistent row widths")
+
+    # Validate every name up front with one set difference, so the render
+    # below is a plain table lookup per cell
+    names = {cell.get("tile_name") for row in tiles for cell in row}
+    if not names <= CHAR_BY_TILE_NAME.keys():
+        # Report the first unknown name in scan order
+        name = next(
+            cell.get("tile_name")
+            for row in tiles
+            for cell in row
+            if cell.get("tile_name") not in CHAR_BY_TILE_NAME
+        )
+        raise ValueError(f'Unknown tile_name "{name}"')
+
+    # Bots are checked up front too and drawn over their tiles in the same
+    # pass, so the grid is only walked once
+    bot_cells = _bot_cells(bots, width, len(tiles))
+
+    lines: List[str] = []
+    for file_row, row in enumerate(tiles):
+        out_row = [CHAR_BY_TILE_NAME[cell["tile_name"]] for cell in row]
+        for x in bot_cells.get(file_row, ()):
+            out_row[x] = "b"
+        lines.append("".join(out_row))
+    return lines
 
 
 def _format_orders(orders: List[dict]) -> List[str]:
@@ -90,13 +105,7 @@ def json_to_txt(data: dict) -> str:
     if tiles is None:
         raise ValueError('JSON missing "tiles"')
 
-    layout = _render_layout(tiles)
-
-    bots = data.get("bots", [])
-    if bots:
-        _place_bots(layout, bots)
-
-    lines = ["".join(r) for r in layout]
+    lines = _render_layout(tiles, data.get("bots") or [])
     lines.extend(_format_orders(data.get("orders", [])))
     return "\n".join(lines) + "\n"
 
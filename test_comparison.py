@@ -4,32 +4,73 @@ Quick test to compare claude_bot-tune performance with and without pause/resume
 We'll run the bot against itself on a simple map and check the scores.
 """
 
+import os
 import subprocess
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def run_test(bot_name, map_name="simple_map.txt", turns=200, runs=3):
-    """Run arena.py and extract the money score for the specified bot."""
-    scores = []
+# Dollar amounts on the "[GAME OVER] money scores: RED=$595, BLUE=$595" line
+MONEY_RE = re.compile(r'\$(\d+)')
+
+
+def run_game(bot_name, map_name, turns, log_path, turn_timeout=0.5, timeout=60):
+    """
+    Run arena.py once and return the RED money score of every match it plays.
+
+    arena.py plays the bot against each opponent in turn and prints a score
+    line per match. Output is read line by line to EOF, so the full log is
+    never held in memory; the watchdog only enforces the timeout.
+    """
+    args = ["python", "arena.py", "--bot", bot_name, "--map", map_name, "--turns", str(turns),
+            "--timeout", str(turn_timeout), "--log", log_path]
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+    timed_out = threading.Event()
+
+    def expire():
+        timed_out.set()
+        proc.kill()
 
-    for i in range(runs):
-        print(f"Running test {i+1}/{runs} for {bot_name}...", file=sys.stderr)
-        result = subprocess.run(
-            ["python", "arena.py", "--bot", bot_name, "--map", map_name, "--turns", str(turns)],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        # Extract the money score from output
-        # Looking for patterns like: [GAME OVER] money scores: RED=$595, BLUE=$595
-        for line in result.stdout.split('\n'):
+    watchdog = threading.Timer(timeout, expire)
+    watchdog.start()
+    scores = []
+    try:
+        for line in proc.stdout:
             if '[GAME OVER]' in line and 'money scores' in line:
                 # Extract numbers after $ signs
-                money_values = re.findall(r'\$(\d+)', line)
+                money_values = MONEY_RE.findall(line)
                 if money_values:
                     # Assume the bot is RED team (first value)
                     scores.append(int(money_values[0]))
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout)
+    return scores
+
+
+def run_test(bot_name, map_name="simple_map.txt", turns=200, runs=3, turn_timeout=0.5):
+    """Run arena.py and extract the money score for the specified bot."""
+    # The runs are independent subprocesses, so several go at once; threads are
+    # enough since each one only waits on its child process. arena.py times bot
+    # turns by wall clock (turn_timeout), so at most one run per CPU is started
+    # to keep turns from being dropped just because the runs compete.
+    print(f"Running {runs} tests for {bot_name}...", file=sys.stderr)
+    workers = max(1, min(runs, os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_game, bot_name, map_name, turns, f"arena_{bot_name}_run{i + 1}.log", turn_timeout)
+            for i in range(runs)
+        ]
+        scores = []
+        for f in futures:
+            scores.extend(f.result())
 
     if scores:
         avg = sum(scores) / len(scores)